@@ -14,8 +14,11 @@ Usage:
     python scripts/compare_scenarios.py --runs 50 --steps 60 --out output/scenarios.png
 """
 
+import os
 import sys
 import argparse
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
 import time
 from pathlib import Path
 
@@ -25,6 +28,7 @@ import matplotlib.patches as mpatches
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.model import GeorgistModel
+from src.soa import advance
 from src.constants import SCENARIOS
 
 
@@ -39,27 +43,49 @@ PALETTE = {
 }
 
 
-def run_scenario(scenario_id: str, runs: int, steps: int) -> np.ndarray:
+def _run_one(task: tuple) -> tuple[int, np.ndarray, np.ndarray]:
+    """Worker: run one seeded simulation, return (run index, Gini series, housing series)."""
+    r, params, seed, steps, numba = task
+    m = GeorgistModel(**params, seed=seed)
+    advance(m, steps, jit=numba)
+    h = m.get_history()
+    return (
+        r,
+        np.asarray(h["gini_coefficient"], dtype=np.float32),
+        np.asarray(h["housing_rate"], dtype=np.float32),
+    )
+
+
+def _init_worker(numba: bool) -> None:
+    """Worker initializer: pay first-run costs (numba cache load) once per process."""
+    advance(GeorgistModel(seed=0), 1, jit=numba)
+
+
+def _fill_row(matrix: np.ndarray, r: int, series: np.ndarray, steps: int) -> None:
+    """Pad (repeating the last value) / truncate one run's series to exactly `steps` values."""
+    if series.size == 0:
+        series = np.zeros(1, dtype=np.float32)
+    matrix[r] = np.pad(series, (0, max(0, steps - series.size)), mode="edge")[:steps]
+
+
+def run_scenario(
+    scenario_id: str, runs: int, steps: int, pool, workers: int, numba: bool = False,
+) -> dict[str, np.ndarray]:
     """
-    Run one scenario N times.
-    Returns array of shape (runs, steps) — Gini per step per run.
+    Run one scenario N times, spread across the worker pool.
+    Returns {"gini": ..., "housing_rate": ...}, each of shape (runs, steps).
     """
     params = SCENARIOS[scenario_id]["params"]
-    matrix = np.zeros((runs, steps))
+    gini_matrix = np.zeros((runs, steps), dtype=np.float32)
+    housing_matrix = np.zeros((runs, steps), dtype=np.float32)
 
-    for r in range(runs):
-        m = GeorgistModel(**params, seed=r * 31337)
-        for s in range(steps):
-            m.step()
-        h = m.get_history()
-        gini_series = h["gini_coefficient"]
-        # Pad / truncate to exactly `steps` values
-        n = min(len(gini_series), steps)
-        matrix[r, :n] = gini_series[:n]
-        if n < steps:
-            matrix[r, n:] = gini_series[-1] if gini_series else 0.0
+    tasks = [(r, params, r * 31337, steps, numba) for r in range(runs)]
+    chunksize = max(1, runs // (4 * workers))
+    for r, gini_series, housing_series in pool.map(_run_one, tasks, chunksize=chunksize):
+        _fill_row(gini_matrix, r, gini_series, steps)
+        _fill_row(housing_matrix, r, housing_series, steps)
 
-    return matrix
+    return {"gini": gini_matrix, "housing_rate": housing_matrix}
 
 
 def plot(
@@ -72,17 +98,17 @@ def plot(
 ):
     fig, ax = plt.subplots(figsize=(12, 6))
 
-    rounds = list(range(1, steps + 1))
+    rounds = np.arange(1, steps + 1)
     handles = []
+    # 95% CI via t-distribution approximation (good enough for ABM)
+    ci_scale = 1.96 / np.sqrt(runs)
 
     for scenario_id, matrix in results.items():
         title = SCENARIOS[scenario_id]["title"]
         color = PALETTE[scenario_id]
 
         mean = matrix.mean(axis=0)
-        std  = matrix.std(axis=0)
-        # 95% CI via t-distribution approximation (good enough for ABM)
-        ci   = 1.96 * std / np.sqrt(runs)
+        ci   = ci_scale * matrix.std(axis=0)
 
         ax.plot(rounds, mean, color=color, linewidth=2, label=title)
         ax.fill_between(rounds, mean - ci, mean + ci, color=color, alpha=0.15)
@@ -124,8 +150,16 @@ def main():
     parser.add_argument("--steps", type=int, default=50,  help="Steps per run")
     parser.add_argument("--out",   type=str, default="output/scenario_comparison.png")
     parser.add_argument("--quick", action="store_true",   help="Fast preview (10 runs)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes")
+    parser.add_argument("--numba", action="store_true", help="Step through the compiled kernel (requires numba)")
     args = parser.parse_args()
 
+    if args.numba:
+        try:
+            import src.model_jit  # noqa: F401 — fail fast, before spawning workers
+        except ImportError:
+            sys.exit("  numba not installed — run: pip install numba")
+
     runs  = 10 if args.quick else args.runs
     steps = args.steps
 
@@ -133,48 +167,37 @@ def main():
     print(f"Scenario comparison")
     print(f"  Scenarios: {list(SCENARIOS.keys())}")
     print(f"  {runs} runs × {steps} steps × {len(SCENARIOS)} scenarios = {total_sims} simulations")
+    print(f"  {args.workers} worker processes")
     print()
 
     results = {}
     t0 = time.time()
 
-    for i, scenario_id in enumerate(SCENARIOS):
-        title = SCENARIOS[scenario_id]["title"]
-        print(f"  [{i+1}/{len(SCENARIOS)}] {title} ...", end="", flush=True)
-        matrix = run_scenario(scenario_id, runs, steps)
-        results[scenario_id] = matrix
-        final_mean = matrix[:, -1].mean()
-        final_std  = matrix[:, -1].std()
-        print(f" Gini R{steps}: {final_mean:.3f} ± {final_std:.3f}")
+    # Runs are independent — spawn keeps workers identical across platforms
+    with ProcessPoolExecutor(
+        max_workers=args.workers, mp_context=mp.get_context("spawn"),
+        initializer=_init_worker, initargs=(args.numba,),
+    ) as pool:
+        for i, scenario_id in enumerate(SCENARIOS):
+            title = SCENARIOS[scenario_id]["title"]
+            print(f"  [{i+1}/{len(SCENARIOS)}] {title} ...", end="", flush=True)
+            results[scenario_id] = run_scenario(scenario_id, runs, steps, pool, args.workers, args.numba)
+            final_gini = results[scenario_id]["gini"][:, -1]
+            final_mean = final_gini.mean()
+            final_std  = final_gini.std()
+            print(f" Gini R{steps}: {final_mean:.3f} ± {final_std:.3f}")
 
     elapsed = time.time() - t0
     print(f"\n  Done in {elapsed:.1f}s")
     print()
 
     # Gini plot
-    plot(results, steps, runs, args.out,
+    plot({sid: d["gini"] for sid, d in results.items()}, steps, runs, args.out,
          metric="gini", metric_label="Gini coefficient")
 
-    # Also save housing rate plot
+    # Housing rate plot — same runs, no second sweep
     housing_out = args.out.replace(".png", "_housing.png")
-    # Re-collect housing rate
-    housing_results = {}
-    for scenario_id in SCENARIOS:
-        params = SCENARIOS[scenario_id]["params"]
-        matrix = np.zeros((runs, steps))
-        for r in range(runs):
-            m = GeorgistModel(**params, seed=r * 31337)
-            for s in range(steps):
-                m.step()
-            h = m.get_history()
-            series = h["housing_rate"]
-            n = min(len(series), steps)
-            matrix[r, :n] = series[:n]
-            if n < steps:
-                matrix[r, n:] = series[-1] if series else 0.0
-        housing_results[scenario_id] = matrix
-
-    plot(housing_results, steps, runs, housing_out,
+    plot({sid: d["housing_rate"] for sid, d in results.items()}, steps, runs, housing_out,
          metric="housing_rate", metric_label="Housing rate (fraction occupied)")
 
 
@@ -11,10 +11,14 @@ market flips from competitive equilibrium to chronic housing crisis.
 Usage:
     python scripts/phase_diagram.py
     python scripts/phase_diagram.py --steps 50 --runs 5 --out output/phase.png
+    python scripts/phase_diagram.py --replot output/phase.npz   # restyle without re-simulating
 """
 
+import os
 import sys
 import argparse
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
 import time
 from pathlib import Path
 
@@ -25,17 +29,17 @@ import matplotlib.colors as mcolors
 # Allow import from project root
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.model import GeorgistModel
+from src.soa import advance
 
 
-def run_single(immigration_rate: int, max_wealth: int, steps: int, seed: int) -> dict:
+def run_single(immigration_rate: int, max_wealth: int, steps: int, seed: int, numba: bool = False) -> dict:
     """Run one simulation, return metrics at final step."""
     m = GeorgistModel(
         immigration_rate=immigration_rate,
         max_wealth=max_wealth,
         seed=seed,
     )
-    for _ in range(steps):
-        m.step()
+    advance(m, steps, jit=numba)
     h = m.get_history()
     return {
         "gini": h["gini_coefficient"][-1] if h["gini_coefficient"] else 0.0,
@@ -43,38 +47,55 @@ def run_single(immigration_rate: int, max_wealth: int, steps: int, seed: int) ->
     }
 
 
+def _init_worker(numba: bool) -> None:
+    """Worker initializer: pay first-run costs (numba cache load) once per process."""
+    advance(GeorgistModel(seed=0), 1, jit=numba)
+
+
+def _run_one(task: tuple) -> tuple[int, int, int, dict]:
+    """Worker: run one (i, j, run) cell of the sweep."""
+    i, j, run, imm, wealth, steps, seed, numba = task
+    return i, j, run, run_single(imm, wealth, steps, seed, numba)
+
+
 def sweep(
     imm_values: list,
     wealth_values: list,
     steps: int,
     runs_per_combo: int,
+    workers: int = os.cpu_count(),
+    numba: bool = False,
 ) -> tuple[np.ndarray, np.ndarray]:
     """
-    Sweep immigration_rate × max_wealth.
+    Sweep immigration_rate × max_wealth across a process pool.
     Returns (gini_grid, housing_grid) shaped (len(imm), len(wealth)).
     """
     n_imm = len(imm_values)
     n_wealth = len(wealth_values)
-    gini_grid = np.zeros((n_imm, n_wealth))
-    housing_grid = np.zeros((n_imm, n_wealth))
-
-    total = n_imm * n_wealth * runs_per_combo
+    # Every (i, j, run) slot is written exactly once below
+    gini_samples = np.empty((n_imm, n_wealth, runs_per_combo), dtype=np.float32)
+    housing_samples = np.empty((n_imm, n_wealth, runs_per_combo), dtype=np.float32)
+
+    # Flatten (i, j, run) — every simulation is independent
+    tasks = [
+        (i, j, run, imm, wealth, steps, i * 10000 + j * 100 + run, numba)
+        for i, imm in enumerate(imm_values)
+        for j, wealth in enumerate(wealth_values)
+        for run in range(runs_per_combo)
+    ]
+    total = len(tasks)
+    chunksize = max(1, total // (4 * workers))
     done = 0
     t0 = time.time()
 
-    for i, imm in enumerate(imm_values):
-        for j, wealth in enumerate(wealth_values):
-            gini_samples = []
-            housing_samples = []
-            for run in range(runs_per_combo):
-                seed = i * 10000 + j * 100 + run
-                result = run_single(imm, wealth, steps, seed)
-                gini_samples.append(result["gini"])
-                housing_samples.append(result["housing_rate"])
-                done += 1
-
-            gini_grid[i, j] = np.mean(gini_samples)
-            housing_grid[i, j] = np.mean(housing_samples)
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=mp.get_context("spawn"),
+        initializer=_init_worker, initargs=(numba,),
+    ) as pool:
+        for i, j, run, result in pool.map(_run_one, tasks, chunksize=chunksize):
+            gini_samples[i, j, run] = result["gini"]
+            housing_samples[i, j, run] = result["housing_rate"]
+            done += 1
 
             elapsed = time.time() - t0
             remaining = (elapsed / done) * (total - done) if done else 0
@@ -84,7 +105,7 @@ def sweep(
             )
 
     print()
-    return gini_grid, housing_grid
+    return gini_samples.mean(axis=-1), housing_samples.mean(axis=-1)
 
 
 def plot(
@@ -124,15 +145,12 @@ def plot(
     ax.set_xticks(wealth_values[::2])
     ax.set_yticks(imm_values[::2])
 
-    # Annotate cells
-    for i in range(len(imm_values)):
-        for j in range(len(wealth_values)):
-            ax.text(
-                wealth_values[j], imm_values[i],
-                f"{gini_grid[i, j]:.2f}",
-                ha="center", va="center", fontsize=7,
-                color="white" if gini_grid[i, j] > 0.35 else "black",
-            )
+    # Annotate cells — labels and text colours computed for the whole grid at once
+    I, W = imm_values, wealth_values
+    labels = np.vectorize("{:.2f}".format)(gini_grid)
+    colors = np.where(gini_grid > 0.35, "white", "black")
+    for (i, j), label, color in zip(np.ndindex(gini_grid.shape), labels.ravel(), colors.ravel()):
+        ax.text(W[j], I[i], label, ha="center", va="center", fontsize=7, color=color)
 
     # --- Housing rate heatmap ---
     ax = axes[1]
@@ -154,14 +172,10 @@ def plot(
     ax.set_xticks(wealth_values[::2])
     ax.set_yticks(imm_values[::2])
 
-    for i in range(len(imm_values)):
-        for j in range(len(wealth_values)):
-            ax.text(
-                wealth_values[j], imm_values[i],
-                f"{housing_grid[i, j]:.0%}",
-                ha="center", va="center", fontsize=7,
-                color="white" if housing_grid[i, j] < 0.5 else "black",
-            )
+    labels = np.vectorize("{:.0%}".format)(housing_grid)
+    colors = np.where(housing_grid < 0.5, "white", "black")
+    for (i, j), label, color in zip(np.ndindex(housing_grid.shape), labels.ravel(), colors.ravel()):
+        ax.text(W[j], I[i], label, ha="center", va="center", fontsize=7, color=color)
 
     fig.text(
         0.5, -0.02,
@@ -177,14 +191,51 @@ def plot(
     plt.show()
 
 
+def save_sweep(path, gini_grid, housing_grid, imm_values, wealth_values, steps, runs):
+    """Cache sweep results next to the figure so --replot can skip the simulations."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(
+        path,
+        gini_grid=gini_grid, housing_grid=housing_grid,
+        imm_values=np.asarray(imm_values), wealth_values=np.asarray(wealth_values),
+        steps=steps, runs=runs,
+    )
+    print(f"  Saved → {path}")
+
+
+def load_sweep(path):
+    """Inverse of save_sweep: (gini_grid, housing_grid, imm_values, wealth_values, steps, runs)."""
+    with np.load(path) as d:
+        return (
+            d["gini_grid"], d["housing_grid"],
+            d["imm_values"].tolist(), d["wealth_values"].tolist(),
+            int(d["steps"]), int(d["runs"]),
+        )
+
+
 def main():
     parser = argparse.ArgumentParser(description="Phase diagram: immigration × wealth → Gini")
     parser.add_argument("--steps", type=int, default=50, help="Steps per simulation")
     parser.add_argument("--runs", type=int, default=5, help="Runs per parameter combo")
     parser.add_argument("--out", type=str, default="output/phase_diagram.png")
     parser.add_argument("--quick", action="store_true", help="Fast preview (coarse grid, 3 runs)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes")
+    parser.add_argument("--numba", action="store_true", help="Step through the compiled kernel (requires numba)")
+    parser.add_argument("--replot", type=str, help="Plot a saved .npz sweep instead of simulating")
     args = parser.parse_args()
 
+    if args.replot:
+        gini_grid, housing_grid, imm_values, wealth_values, steps, runs = load_sweep(args.replot)
+        print(f"Replotting {args.replot}")
+        plot(gini_grid, housing_grid, imm_values, wealth_values, steps, runs, args.out)
+        return
+
+    if args.numba:
+        try:
+            import src.model_jit  # noqa: F401 — fail fast, before spawning workers
+        except ImportError:
+            sys.exit("  numba not installed — run: pip install numba")
+
     if args.quick:
         imm_values  = list(range(2, 18, 3))   # 6 values
         wealth_values = list(range(10, 55, 8)) # 6 values
@@ -199,16 +250,18 @@ def main():
     print(f"  immigration_rate: {imm_values}")
     print(f"  max_wealth:       {wealth_values}")
     print(f"  {len(imm_values)} × {len(wealth_values)} combos × {runs} runs = {total} simulations")
-    print(f"  {args.steps} steps each")
+    print(f"  {args.steps} steps each, {args.workers} worker processes")
     print()
 
-    gini_grid, housing_grid = sweep(imm_values, wealth_values, args.steps, runs)
+    gini_grid, housing_grid = sweep(imm_values, wealth_values, args.steps, runs, args.workers, args.numba)
 
     print()
     print(f"  Gini range:        {gini_grid.min():.3f} – {gini_grid.max():.3f}")
     print(f"  Housing rate range: {housing_grid.min():.1%} – {housing_grid.max():.1%}")
     print()
 
+    save_sweep(Path(args.out).with_suffix(".npz"),
+               gini_grid, housing_grid, imm_values, wealth_values, args.steps, runs)
     plot(gini_grid, housing_grid, imm_values, wealth_values, args.steps, runs, args.out)
 
 
@@ -2,7 +2,9 @@
 Interactive 3D Phase Surface — Immigration Rate × Max Wealth × Gini
 
 Same data as phase_diagram.py, rendered as an interactive Plotly 3D surface.
-Saves as a self-contained HTML file — no server required.
+Saves as a single HTML file — no server required. plotly.js loads from its
+CDN by default (~3 MB lighter per file); pass --bundle to embed it for
+offline viewing.
 
 This is the "explore interactively" artifact linked from the newsletter,
 not the inline figure. A 2D heatmap reads better as a static Substack image;
@@ -11,10 +13,15 @@ this is for readers who want to rotate the landscape themselves.
 Usage:
     python scripts/phase_diagram_3d.py
     python scripts/phase_diagram_3d.py --runs 3 --quick --out output/phase_3d.html
+    python scripts/phase_diagram_3d.py --quick --bundle
+    python scripts/phase_diagram_3d.py --replot output/phase_3d.npz
 """
 
+import os
 import sys
 import argparse
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
 import time
 from pathlib import Path
 
@@ -22,12 +29,12 @@ import numpy as np
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.model import GeorgistModel
+from src.soa import advance
 
 
-def run_single(immigration_rate: int, max_wealth: int, steps: int, seed: int) -> dict:
+def run_single(immigration_rate: int, max_wealth: int, steps: int, seed: int, numba: bool = False) -> dict:
     m = GeorgistModel(immigration_rate=immigration_rate, max_wealth=max_wealth, seed=seed)
-    for _ in range(steps):
-        m.step()
+    advance(m, steps, jit=numba)
     h = m.get_history()
     return {
         "gini": h["gini_coefficient"][-1] if h["gini_coefficient"] else 0.0,
@@ -35,38 +42,52 @@ def run_single(immigration_rate: int, max_wealth: int, steps: int, seed: int) ->
     }
 
 
-def sweep(imm_values, wealth_values, steps, runs_per_combo):
+def _init_worker(numba):
+    # Pay first-run costs (numba cache load) once per process, not in the first task
+    advance(GeorgistModel(seed=0), 1, jit=numba)
+
+
+def _run_one(task):
+    i, j, run, imm, wealth, steps, seed, numba = task
+    return i, j, run, run_single(imm, wealth, steps, seed, numba)
+
+
+def sweep(imm_values, wealth_values, steps, runs_per_combo, workers=os.cpu_count(), numba=False):
     n_imm    = len(imm_values)
     n_wealth = len(wealth_values)
-    gini_grid    = np.zeros((n_imm, n_wealth))
-    housing_grid = np.zeros((n_imm, n_wealth))
-
-    total = n_imm * n_wealth * runs_per_combo
+    # Every (i, j, run) slot is written exactly once below
+    gini_samples    = np.empty((n_imm, n_wealth, runs_per_combo), dtype=np.float32)
+    housing_samples = np.empty((n_imm, n_wealth, runs_per_combo), dtype=np.float32)
+
+    tasks = [
+        (i, j, run, imm, wealth, steps, i * 10000 + j * 100 + run, numba)
+        for i, imm in enumerate(imm_values)
+        for j, wealth in enumerate(wealth_values)
+        for run in range(runs_per_combo)
+    ]
+    total     = len(tasks)
+    chunksize = max(1, total // (4 * workers))
     done  = 0
     t0    = time.time()
 
-    for i, imm in enumerate(imm_values):
-        for j, wealth in enumerate(wealth_values):
-            gini_samples    = []
-            housing_samples = []
-            for run in range(runs_per_combo):
-                seed   = i * 10000 + j * 100 + run
-                result = run_single(imm, wealth, steps, seed)
-                gini_samples.append(result["gini"])
-                housing_samples.append(result["housing_rate"])
-                done += 1
-            gini_grid[i, j]    = np.mean(gini_samples)
-            housing_grid[i, j] = np.mean(housing_samples)
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=mp.get_context("spawn"),
+        initializer=_init_worker, initargs=(numba,),
+    ) as pool:
+        for i, j, run, result in pool.map(_run_one, tasks, chunksize=chunksize):
+            gini_samples[i, j, run]    = result["gini"]
+            housing_samples[i, j, run] = result["housing_rate"]
+            done += 1
             elapsed   = time.time() - t0
             remaining = (elapsed / done) * (total - done) if done else 0
             print(f"\r  {done}/{total}  [{elapsed:.0f}s elapsed, ~{remaining:.0f}s remaining]",
                   end="", flush=True)
 
     print()
-    return gini_grid, housing_grid
+    return gini_samples.mean(axis=-1), housing_samples.mean(axis=-1)
 
 
-def build_html(gini_grid, housing_grid, imm_values, wealth_values, steps, runs, out_path):
+def build_html(gini_grid, housing_grid, imm_values, wealth_values, steps, runs, out_path, bundle=False):
     try:
         import plotly.graph_objects as go
         from plotly.subplots import make_subplots
@@ -139,19 +160,60 @@ def build_html(gini_grid, housing_grid, imm_values, wealth_values, steps, runs,
     )
 
     Path(out_path).parent.mkdir(parents=True, exist_ok=True)
-    pio.write_html(fig, out_path, full_html=True, include_plotlyjs=True)
+    # fig is built here, so skip Plotly's per-trace validation pass
+    pio.write_html(
+        fig, out_path, full_html=True,
+        include_plotlyjs=True if bundle else "cdn",
+        include_mathjax=False, validate=False,
+    )
     print(f"  Saved → {out_path}")
     print(f"  Open in browser: open {out_path}")
 
 
+def save_sweep(path, gini_grid, housing_grid, imm_values, wealth_values, steps, runs):
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(
+        path,
+        gini_grid=gini_grid, housing_grid=housing_grid,
+        imm_values=np.asarray(imm_values), wealth_values=np.asarray(wealth_values),
+        steps=steps, runs=runs,
+    )
+    print(f"  Saved → {path}")
+
+
+def load_sweep(path):
+    with np.load(path) as d:
+        return (
+            d["gini_grid"], d["housing_grid"],
+            d["imm_values"].tolist(), d["wealth_values"].tolist(),
+            int(d["steps"]), int(d["runs"]),
+        )
+
+
 def main():
     parser = argparse.ArgumentParser(description="Interactive 3D phase surface (Plotly HTML)")
     parser.add_argument("--steps", type=int, default=50)
     parser.add_argument("--runs",  type=int, default=5)
     parser.add_argument("--out",   type=str, default="output/phase_3d.html")
     parser.add_argument("--quick", action="store_true", help="Coarse grid, 3 runs")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--numba", action="store_true", help="Compiled kernel (requires numba)")
+    parser.add_argument("--bundle", action="store_true", help="Embed plotly.js for offline viewing")
+    parser.add_argument("--replot", type=str, help="Rebuild HTML from a saved .npz sweep")
     args = parser.parse_args()
 
+    if args.replot:
+        gini_grid, housing_grid, imm_values, wealth_values, steps, runs = load_sweep(args.replot)
+        print(f"Replotting {args.replot}")
+        build_html(gini_grid, housing_grid, imm_values, wealth_values, steps, runs, args.out, args.bundle)
+        return
+
+    if args.numba:
+        try:
+            import src.model_jit  # noqa: F401 — fail fast, before spawning workers
+        except ImportError:
+            sys.exit("  numba not installed — run: pip install numba")
+
     if args.quick:
         imm_values    = list(range(2, 18, 4))
         wealth_values = list(range(10, 55, 10))
@@ -166,9 +228,11 @@ def main():
     print(f"  {len(imm_values)} × {len(wealth_values)} combos × {runs} runs = {total} simulations")
     print()
 
-    gini_grid, housing_grid = sweep(imm_values, wealth_values, args.steps, runs)
+    gini_grid, housing_grid = sweep(imm_values, wealth_values, args.steps, runs, args.workers, args.numba)
     print()
-    build_html(gini_grid, housing_grid, imm_values, wealth_values, args.steps, runs, args.out)
+    save_sweep(Path(args.out).with_suffix(".npz"),
+               gini_grid, housing_grid, imm_values, wealth_values, args.steps, runs)
+    build_html(gini_grid, housing_grid, imm_values, wealth_values, args.steps, runs, args.out, args.bundle)
 
 
 if __name__ == "__main__":
@@ -12,6 +12,7 @@ Usage:
     python scripts/run.py
     python scripts/run.py --scenario inequality --seed 42 --steps 52
     python scripts/run.py --scenario declining-city --seed 99 --steps 100 --out results/
+    python scripts/run.py --scenario balanced --seed 42 --steps 500 --numba
 """
 
 import sys
@@ -24,6 +25,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 import mesa
+import numpy as np
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.model import GeorgistModel
@@ -31,13 +33,28 @@ from src.constants import SCENARIOS
 
 
 def sha256_file(path: str) -> str:
+    """Hash an existing file in 1 MiB chunks (e.g. a collaborator's CSV)."""
     h = hashlib.sha256()
     with open(path, "rb") as f:
-        h.update(f.read())
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
     return h.hexdigest()
 
 
-def run(scenario_id: str, seed: int, steps: int, out_dir: str) -> dict:
+class _HashingWriter:
+    """Binary file wrapper that SHA-256s every write on its way to disk."""
+
+    def __init__(self, f):
+        self.f = f
+        self.sha256 = hashlib.sha256()
+
+    def write(self, text: str) -> int:
+        data = text.encode()
+        self.sha256.update(data)
+        return self.f.write(data)
+
+
+def run(scenario_id: str, seed: int, steps: int, out_dir: str, numba: bool = False) -> dict:
     """Run simulation, export CSV, return receipt dict."""
     scenario = SCENARIOS[scenario_id]
     params   = scenario["params"]
@@ -45,8 +62,12 @@ def run(scenario_id: str, seed: int, steps: int, out_dir: str) -> dict:
     m = GeorgistModel(**params, seed=seed)
 
     t0 = time.time()
-    for _ in range(steps):
-        m.step()
+    if numba:
+        from src.soa import advance
+        advance(m, steps, jit=True)
+    else:
+        for _ in range(steps):
+            m.step()
     elapsed = time.time() - t0
 
     # Export time-series CSV
@@ -56,18 +77,17 @@ def run(scenario_id: str, seed: int, steps: int, out_dir: str) -> dict:
 
     history = m.get_history()
     columns = list(history.keys())
-    n_rows  = len(history[columns[0]])
-
-    with open(csv_path, "w") as f:
-        f.write(",".join(columns) + "\n")
-        for i in range(n_rows):
-            row = []
-            for col in columns:
-                v = history[col][i]
-                row.append(f"{v:.6f}" if isinstance(v, float) else str(v))
-            f.write(",".join(row) + "\n")
 
-    csv_hash = sha256_file(str(csv_path))
+    # One column-stacked array, formatted in C; integer columns stay integers
+    col_arrays = [np.asarray(history[col]) for col in columns]
+    fmt = ["%d" if np.issubdtype(a.dtype, np.integer) else "%.6f" for a in col_arrays]
+    with open(csv_path, "wb") as f:
+        out = _HashingWriter(f)
+        np.savetxt(
+            out, np.column_stack(col_arrays), fmt=fmt,
+            delimiter=",", header=",".join(columns), comments="",
+        )
+    csv_hash = out.sha256.hexdigest()
 
     # Final state summary
     final = {col: history[col][-1] for col in columns if history[col]}
@@ -78,6 +98,7 @@ def run(scenario_id: str, seed: int, steps: int, out_dir: str) -> dict:
         "seed":          seed,
         "steps":         steps,
         "params":        params,
+        "engine":        "numba" if numba else "python",
         "mesa_version":  mesa.__version__,
         "python":        platform.python_version(),
         "platform":      platform.system(),
@@ -103,6 +124,7 @@ def print_receipt(r: dict):
     print(f"  Scenario : {r['scenario_title']}")
     print(f"  Seed     : {r['seed']}")
     print(f"  Steps    : {r['steps']}")
+    print(f"  Engine   : {r['engine']}")
     print(f"  Mesa     : {r['mesa_version']}")
     print(f"  Python   : {r['python']}  ({r['platform']})")
     print(f"  Run time : {r['elapsed_s']}s")
@@ -124,7 +146,9 @@ def print_receipt(r: dict):
     print(f"    python scripts/run.py \\")
     print(f"      --scenario {r['scenario_id']} \\")
     print(f"      --seed {r['seed']} \\")
-    print(f"      --steps {r['steps']}")
+    print(f"      --steps {r['steps']}" + (" \\" if r["engine"] == "numba" else ""))
+    if r["engine"] == "numba":
+        print(f"      --numba")
     print()
 
 
@@ -137,10 +161,17 @@ def main():
     parser.add_argument("--steps", type=int, default=52,   help="Number of rounds")
     parser.add_argument("--out",   type=str, default="results/", help="Output directory")
     parser.add_argument("--json",  action="store_true", help="Also write receipt as JSON")
+    parser.add_argument("--numba", action="store_true", help="Step through the compiled kernel (requires numba)")
     args = parser.parse_args()
 
+    if args.numba:
+        try:
+            import src.model_jit  # noqa: F401
+        except ImportError:
+            sys.exit("  numba not installed — run: pip install numba")
+
     print(f"Running {SCENARIOS[args.scenario]['title']} · seed={args.seed} · {args.steps} steps …")
-    receipt = run(args.scenario, args.seed, args.steps, args.out)
+    receipt = run(args.scenario, args.seed, args.steps, args.out, args.numba)
     print_receipt(receipt)
 
     if args.json:
@@ -2,95 +2,369 @@
 Flask server for Georgist Land Value Simulation
 
 Flat file (RSC ABM pattern) — no blueprints.
+Each browser gets its own model (sid cookie, handed out by the dashboard
+page), so clients don't block each other. API requests without the cookie
+(scripts, curl, uptime probes) share one default model, as before
+per-browser models. JSON / CSV responses over 4 KiB are gzipped.
 
 Endpoints:
   GET  /                       Dashboard
   POST /api/init               Initialize with params
-  POST /api/step               Advance N steps
-  GET  /api/state              Full grid + agents + stats
-  GET  /api/history            DataCollector time-series
+  POST /api/step               Advance N steps, 1–10000 (batched through src.soa for large N)
+  GET  /api/step/status/<job>  Poll a background step job ({"background": true})
+  GET  /api/state              Full grid + agents + stats (?format=columns for columnar parcels)
+  GET  /api/history            Time-series history (?since=<round> for new rows only)
   POST /api/scenario           Load preset by name
   GET  /api/scenarios          List all presets
   POST /api/reset              Reset to defaults
   GET  /api/export/csv         Full time-series CSV (Mesa advantage)
   GET  /api/parcel/<id>        Single parcel + history
-  GET  /api/runs               List all saved prior runs
+  GET  /api/runs               List saved prior runs, newest first (?limit=K)
   GET  /api/runs/<run_id>      Retrieve a specific saved run
 """
 
 import os
-import io
-import csv
+import bisect
+import gzip
+import hashlib
+import heapq
 import json
+import multiprocessing as mp
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
-from flask import Flask, jsonify, request, render_template
+import numpy as np
+from flask import Flask, Response, g, jsonify, request, render_template
+from flask.json.provider import DefaultJSONProvider
 
 from src import GeorgistModel, SCENARIOS, DEFAULT_PARAMS
+from src.soa import GRID_SIZE, N_PARCELS, advance, step_detached
+
+try:
+    import src.model_jit  # noqa: F401
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # stdlib json fallback — same JSON, slower
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None  # _finish_response gzips buffered bodies instead
+
+
+def _dumps(obj) -> bytes:
+    if orjson is None:
+        return json.dumps(obj).encode()
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+
+def _loads(data):
+    return json.loads(data) if orjson is None else orjson.loads(data)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """jsonify() / request.get_json() through orjson; numpy values serialise natively."""
+
+    def _encode(self, obj) -> bytes:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj, **kwargs) -> str:
+        return self._encode(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._encode(obj), mimetype=self.mimetype)
+
 
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 
 RESULTS_DIR = Path("results")
 MAX_SAVED_RUNS = 20
-
-# Global model instance (stateful — one simulation per server)
-_model: GeorgistModel = None
-_current_scenario_id: str = None  # track which scenario is loaded
+MAX_SESSIONS = 32          # browser sessions held at once; cookieless requests share one more
+SESSION_IDLE_SECONDS = 30 * 60   # a session unused this long is saved and dropped
+SESSION_COOKIE = "sid"
+GZIP_MIN_BYTES = 4096      # smaller responses aren't worth compressing
+CSV_BLOCK_ROWS = 256       # rows per chunk of the streamed CSV export
+BATCH_STEP_MIN = 10        # /api/step batches at least this long go through the array path
+MAX_STEPS = 10_000         # /api/step refuses longer batches (the array path preallocates per round)
+
+
+class Session:
+    """One browser's simulation. Requests in a session are serialised by its lock."""
+
+    def __init__(self):
+        self.model: GeorgistModel = None
+        self.scenario_id: str = None  # track which scenario is loaded
+        self.lock = threading.Lock()
+        self.version = 0              # bumped once a step batch finishes or the model is replaced
+        self.token = uuid.uuid4().hex[:8]   # keeps ETags unique across sessions / restarts
+        self.cache: dict = {}         # name → (version, value), see cached()
+        self.job: tuple[str, Future] = None   # (job id, future) of a background step job
+        self.last_used = time.monotonic()
+
+    @property
+    def idle(self) -> bool:
+        """Unused for SESSION_IDLE_SECONDS, with no request or background job in flight."""
+        return (
+            time.monotonic() - self.last_used > SESSION_IDLE_SECONDS
+            and self.job is None
+            and not self.lock.locked()
+        )
+
+    @property
+    def etag(self) -> str:
+        """Version of the model's state / history — changes on every step or reset."""
+        return f"{self.token}-{self.version}"
+
+    def cached(self, name: str, build):
+        """
+        build() for the model's current step, rebuilt only after a step or
+        reset — the dashboard polls state / history between steps.
+
+        Keyed on `version` rather than model.steps: Mesa bumps steps before
+        step() runs, so a build during a step would be filed under the
+        finished step's key.
+        """
+        version = self.version
+        hit = self.cache.get(name)
+        if hit is not None and hit[0] == version:
+            return hit[1]
+        value = build()
+        self.cache[name] = (version, value)
+        return value
+
+    def changed(self) -> None:
+        """Mark the model as advanced or replaced — call after the change is complete."""
+        self.version += 1
+
+
+# One simulation per browser session (sid cookie), so clients don't queue
+# behind each other's steps; least recently used first
+_sessions: "OrderedDict[str, Session]" = OrderedDict()
+_sessions_lock = threading.Lock()
+
+# Requests without a session cookie all use this one
+_shared_session = Session()
+
+
+# Worker processes for background step jobs, started on first use
+_step_pool: ProcessPoolExecutor = None
+_step_pool_lock = threading.Lock()
+
+
+def _get_step_pool() -> ProcessPoolExecutor:
+    global _step_pool
+    with _step_pool_lock:
+        if _step_pool is None:
+            _step_pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=mp.get_context("spawn"))
+        return _step_pool
+
+
+def get_session(create: bool = False) -> Session:
+    """
+    Session for the current request's sid cookie. A new one is started for
+    the dashboard page (`create`) or a cookie the server no longer knows;
+    requests without a cookie get the shared session. Sessions idle for
+    SESSION_IDLE_SECONDS are saved and dropped as new ones start — never one
+    in use, so with MAX_SESSIONS busy a newcomer shares the default model.
+    """
+    if "session" in g:
+        return g.session
+    sid = request.cookies.get(SESSION_COOKIE)
+    evicted = []
+    with _sessions_lock:
+        session = _sessions.get(sid)
+        if session is None and (create or sid is not None):
+            while _sessions and next(iter(_sessions.values())).idle:
+                evicted.append(_sessions.popitem(last=False)[1])
+            if len(_sessions) < MAX_SESSIONS:
+                sid = uuid.uuid4().hex
+                session = _sessions[sid] = Session()
+                g.new_sid = sid
+        if session is None:
+            session = _shared_session
+        else:
+            _sessions.move_to_end(sid)
+        session.last_used = time.monotonic()
+        g.session = session
+    for old in evicted:
+        with old.lock:
+            _save_run_if_worthwhile(old)
+    return session
 
 
 def get_model() -> GeorgistModel:
-    global _model
-    if _model is None:
-        _model = GeorgistModel()
-    return _model
+    session = get_session()
+    if session.model is None:
+        session.model = GeorgistModel()
+    return session.model
+
+
+# Runs saved before manifests are one file holding the whole run, history
+# included: <id>.json, or gzipped <id>.json.gz
+LEGACY_RUN_SUFFIX = ".json.gz"
+
+
+def _is_run_file(name: str) -> bool:
+    return name.endswith(".json") or name.endswith(LEGACY_RUN_SUFFIX)
+
+
+def _run_id(name: str) -> str:
+    """Run id from a run filename (or a legacy id, which kept its extension)."""
+    return name.removesuffix(".gz").removesuffix(".json")
+
+
+def _read_run(path: Path) -> dict:
+    data = path.read_bytes()
+    return _loads(gzip.decompress(data) if path.name.endswith(".gz") else data)
+
+
+def _load_saved_runs() -> deque:
+    """Roster of saved run files, oldest first; prunes any beyond MAX_SAVED_RUNS."""
+    runs = sorted((p for p in RESULTS_DIR.glob("*.json*") if _is_run_file(p.name)), key=lambda p: p.name)
+    for old in runs[:-MAX_SAVED_RUNS]:
+        _delete_run(old)
+    return deque(runs[-MAX_SAVED_RUNS:], maxlen=MAX_SAVED_RUNS)
 
 
-def _save_run_if_worthwhile():
-    """Auto-save current run to disk before reset, if it has history."""
-    global _model, _current_scenario_id
-    if _model is None:
+def _delete_run(path: Path) -> None:
+    path.with_name(f"{_run_id(path.name)}.npz").unlink(missing_ok=True)
+    path.unlink(missing_ok=True)
+
+
+# Tracked in memory so a save doesn't re-scan RESULTS_DIR to prune
+_saved_runs = _load_saved_runs()
+_saved_runs_lock = threading.Lock()
+
+
+def _save_run_if_worthwhile(session: Session):
+    """Auto-save a session's run to disk before reset, if it has history."""
+    m = session.model
+    if m is None:
         return
-    history = _model.get_history()
+    history = session.cached("history", m.get_history)
     rounds = history.get("round", [])
     if not rounds:
         return  # Nothing ran — don't save
 
     RESULTS_DIR.mkdir(exist_ok=True)
-    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
-    scenario_id = _current_scenario_id or "custom"
-    filename = f"{ts}_{scenario_id}.json"
+    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S.%f")  # sessions may save in the same second
+    scenario_id = session.scenario_id or "custom"
+    run_id = f"{ts}_{scenario_id}"
 
     scenario_title = (
         SCENARIOS[scenario_id]["title"] if scenario_id in SCENARIOS else "Custom"
     )
-    final_stats = _model.get_state()["stats"]
+    state = session.cached("state", m.get_state)
 
-    payload = {
-        "id": filename,
+    manifest = {
+        "id": run_id,
         "scenario_id": scenario_id,
         "scenario_title": scenario_title,
         "timestamp": datetime.now(timezone.utc).isoformat(),
-        "rounds": _model.current_round,
-        "params": _model.get_state()["params"],
-        "final_stats": final_stats,
-        "history": history,
+        "rounds": m.current_round,
+        "params": state["params"],
+        "final_stats": state["stats"],
     }
 
-    with open(RESULTS_DIR / filename, "w") as f:
-        json.dump(payload, f)
+    # Time series as binary columns in <id>.npz; the small <id>.json manifest
+    # is all /api/runs needs to read. Manifest last, renamed into place whole
+    # — it marks a complete run.
+    manifest_path = RESULTS_DIR / f"{run_id}.json"
+    np.savez(manifest_path.with_suffix(".npz"), **{col: np.asarray(values) for col, values in history.items()})
+    tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+    tmp_path.write_bytes(_dumps(manifest))
+    os.replace(tmp_path, manifest_path)
 
-    # Prune oldest runs beyond MAX_SAVED_RUNS
-    runs = sorted(RESULTS_DIR.glob("*.json"))
-    for old in runs[:-MAX_SAVED_RUNS]:
-        old.unlink()
+    # Prune the oldest run once the roster is full
+    with _saved_runs_lock:
+        evicted = _saved_runs[0] if len(_saved_runs) == _saved_runs.maxlen else None
+        _saved_runs.append(manifest_path)
+    if evicted is not None:
+        _delete_run(evicted)
 
 
 def reset_model(**kwargs) -> GeorgistModel:
-    global _model
-    _save_run_if_worthwhile()
-    _model = GeorgistModel(**kwargs)
-    return _model
+    session = get_session()
+    _save_run_if_worthwhile(session)
+    session.model = GeorgistModel(**kwargs)
+    session.job = None              # a running job's result no longer applies
+    session.changed()
+    session.cache.clear()
+    return session.model
+
+
+def _conditional(etag: str, build):
+    """304 if the client already holds `etag`, else build() tagged with it."""
+    # flask-compress hands out "<etag>:<encoding>" for compressed bodies
+    if any(tag == etag or tag.startswith(etag + ":") for tag in request.if_none_match):
+        response = app.response_class(status=304)
+    else:
+        response = build()
+    response.set_etag(etag)
+    response.cache_control.no_cache = True   # revalidate every poll
+    return response
+
+
+@app.after_request
+def _finish_response(response):
+    """
+    Hand out the session cookie; gzip large buffered JSON / CSV bodies when
+    flask-compress isn't installed.
+    """
+    if "new_sid" in g:
+        response.set_cookie(SESSION_COOKIE, g.new_sid, httponly=True, samesite="Lax")
+
+    if Compress is not None:
+        return response
+    compressible = (
+        response.status_code == 200
+        and not response.direct_passthrough
+        and not response.is_streamed
+        and response.mimetype in ("application/json", "text/csv")
+    )
+    # Whether or not this body is gzipped, the encoding depends on the
+    # request's Accept-Encoding — caches must key on it (304s included)
+    if compressible or response.status_code == 304:
+        response.vary.add("Accept-Encoding")
+    if (
+        compressible
+        and request.accept_encodings["gzip"]   # quality-aware: "gzip;q=0" is a refusal
+        and "Content-Encoding" not in response.headers
+    ):
+        data = response.get_data()
+        if len(data) >= GZIP_MIN_BYTES:
+            response.set_data(gzip.compress(data, compresslevel=1))
+            response.headers["Content-Encoding"] = "gzip"
+    return response
+
+
+if Compress is not None:
+    # Brotli / gzip, streamed CSV exports included (compressed chunk by chunk)
+    app.config.update(
+        COMPRESS_MIMETYPES=["application/json", "text/csv"],
+        COMPRESS_MIN_SIZE=GZIP_MIN_BYTES,
+        COMPRESS_STREAMS=True,
+    )
+    Compress(app)
 
 
 # =============================================================================
@@ -99,6 +373,7 @@ def reset_model(**kwargs) -> GeorgistModel:
 
 @app.route("/")
 def index():
+    get_session(create=True)   # hands out the sid cookie
     return render_template("index.html")
 
 
@@ -115,169 +390,324 @@ VALID_PARAMS = {
 @app.route("/api/init", methods=["POST"])
 def api_init():
     """Initialize model with params. Resets any prior run."""
-    global _current_scenario_id
     data = request.get_json() or {}
     params = {k: v for k, v in data.items() if k in VALID_PARAMS and v is not None}
-    m = reset_model(**params)       # saves current run first (uses existing scenario id)
-    _current_scenario_id = None     # then clear for the new run
-    return jsonify({"status": "initialized", "state": m.get_state()})
+    session = get_session()
+    with session.lock:
+        m = reset_model(**params)       # saves current run first (uses existing scenario id)
+        session.scenario_id = None      # then clear for the new run
+        return jsonify({"status": "initialized", "state": m.get_state()})
 
 
 @app.route("/api/reset", methods=["POST"])
 def api_reset():
     """Reset to default params (or pass custom params)."""
-    global _current_scenario_id
     data = request.get_json() or {}
     params = {k: v for k, v in data.items() if k in VALID_PARAMS and v is not None}
-    m = reset_model(**params)       # saves current run first (uses existing scenario id)
-    _current_scenario_id = None     # then clear for the new run
-    return jsonify({"status": "reset", "state": m.get_state()})
+    session = get_session()
+    with session.lock:
+        m = reset_model(**params)       # saves current run first (uses existing scenario id)
+        session.scenario_id = None      # then clear for the new run
+        return jsonify({"status": "reset", "state": m.get_state()})
 
 
 @app.route("/api/step", methods=["POST"])
 def api_step():
-    """Advance N steps (default 1)."""
+    """
+    Advance N steps (default 1; more than MAX_STEPS is a 400). Batches of
+    BATCH_STEP_MIN or more run through src.soa (compiled when numba is
+    installed) — same results and parcel events.
+
+    With "background": true the batch runs in a worker process instead and
+    this returns a job id at once; poll /api/step/status/<job> for the state.
+    "format": "columns" returns the columnar state (see GeorgistModel.get_state).
+    """
     data = request.get_json() or {}
-    steps = max(1, int(data.get("steps", 1)))
-    m = get_model()
-    for _ in range(steps):
-        m.step()
-    return jsonify(m.get_state())
+    try:
+        steps = max(1, int(data.get("steps", 1)))
+    except (TypeError, ValueError, OverflowError):
+        return jsonify({"error": "steps must be an integer"}), 400
+    if steps > MAX_STEPS:
+        return jsonify({"error": f"steps must be at most {MAX_STEPS}"}), 400
+    session = get_session()
+    with session.lock:
+        if session.job is not None:
+            return jsonify({"error": "A background step job is still running", "job": session.job[0]}), 409
+        m = get_model()
+        if data.get("background"):
+            job_id = uuid.uuid4().hex
+            future = _get_step_pool().submit(step_detached, m.to_soa(steps, events=True), steps, HAVE_NUMBA)
+            session.job = (job_id, future)
+            return jsonify({"job": job_id, "status": "running"}), 202
+        if steps >= BATCH_STEP_MIN:
+            advance(m, steps, jit=HAVE_NUMBA, events=True)
+        else:
+            for _ in range(steps):
+                m.step()
+        session.changed()
+        return _state_response(session, columns=data.get("format") == "columns")
+
+
+@app.route("/api/step/status/<job_id>")
+def api_step_status(job_id: str):
+    """Poll a background step job; once finished its rounds are applied and the state returned."""
+    session = get_session()
+    with session.lock:
+        if session.job is None or session.job[0] != job_id:
+            return jsonify({"error": "Unknown job"}), 404
+        future = session.job[1]
+        if not future.done():
+            return jsonify({"job": job_id, "status": "running"})
+        session.job = None
+        try:
+            session.model.ingest_soa(future.result())
+        except Exception as exc:
+            return jsonify({"job": job_id, "status": "failed", "error": str(exc)}), 500
+        session.changed()
+        state = session.cached("state", session.model.get_state)
+        return jsonify({"job": job_id, "status": "done", "state": state})
+
+
+def _state_response(session: Session, columns: bool = False):
+    """get_state() as JSON, encoded once per step (see Session.cached)."""
+    name = "state_columns" if columns else "state"
+    state = session.cached(name, lambda: session.model.get_state(columns=columns))
+    body = session.cached(name + "_json", lambda: jsonify(state).get_data())
+    return app.response_class(body, mimetype="application/json")
 
 
 @app.route("/api/state")
 def api_state():
     """Full grid + agents + stats."""
-    return jsonify(get_model().get_state())
+    session = get_session()
+    columns = request.args.get("format") == "columns"
+    with session.lock:
+        get_model()
+        etag = f"{session.etag}-c" if columns else session.etag
+        return _conditional(etag, lambda: _state_response(session, columns))
 
 
 @app.route("/api/history")
 def api_history():
-    """DataCollector time-series (Mesa advantage over TSX)."""
-    return jsonify(get_model().get_history())
+    """
+    Time-series history (Mesa advantage over TSX).
+    ?since=<round> returns only rows after that round, so a polling client
+    fetches the new rows rather than the whole run each time.
+    """
+    session = get_session()
+    since = request.args.get("since", 0, type=int)
+
+    def build():
+        history = session.cached("history", session.model.get_history)
+        if since > 0:
+            start = bisect.bisect_right(history["round"], since)
+            return jsonify({col: values[start:] for col, values in history.items()})
+        body = session.cached("history_json", lambda: jsonify(history).get_data())
+        return app.response_class(body, mimetype="application/json")
+
+    with session.lock:
+        get_model()
+        return _conditional(session.etag, build)
 
 
 @app.route("/api/scenario", methods=["POST"])
 def api_scenario():
     """Load a preset scenario by id."""
-    global _current_scenario_id
     data = request.get_json() or {}
     scenario_id = data.get("id", "balanced")
 
     if scenario_id not in SCENARIOS:
         return jsonify({"error": f"Unknown scenario: {scenario_id}", "available": list(SCENARIOS)}), 400
 
-    _current_scenario_id = scenario_id
     s = SCENARIOS[scenario_id]
-    m = reset_model(**s["params"])
-    return jsonify({
-        "scenario": s["id"],
-        "title": s["title"],
-        "description": s["description"],
-        "state": m.get_state(),
-    })
+    session = get_session()
+    with session.lock:
+        session.scenario_id = scenario_id
+        m = reset_model(**s["params"])
+        return jsonify({
+            "scenario": s["id"],
+            "title": s["title"],
+            "description": s["description"],
+            "state": m.get_state(),
+        })
+
+
+# Presets and defaults are fixed at import — encode their responses once
+_SCENARIOS_JSON = app.json.dumps([
+    {"id": s["id"], "title": s["title"], "description": s["description"], "params": s["params"]}
+    for s in SCENARIOS.values()
+]).encode()
+_DEFAULTS_JSON = app.json.dumps(DEFAULT_PARAMS).encode()
+_SCENARIOS_ETAG = hashlib.sha1(_SCENARIOS_JSON).hexdigest()
+_DEFAULTS_ETAG = hashlib.sha1(_DEFAULTS_JSON).hexdigest()
 
 
 @app.route("/api/scenarios")
 def api_scenarios():
     """List all scenario presets."""
-    return jsonify([
-        {"id": s["id"], "title": s["title"], "description": s["description"], "params": s["params"]}
-        for s in SCENARIOS.values()
-    ])
+    return _conditional(
+        _SCENARIOS_ETAG, lambda: app.response_class(_SCENARIOS_JSON, mimetype="application/json"),
+    )
+
+
+def _format_4dp(values) -> np.ndarray:
+    """
+    str(round(v, 4)) for a whole float column. printf rounds the exact binary
+    value the same way round() does (np.round would not on ties such as
+    8.94375); trailing zeros are then trimmed back to repr form.
+    """
+    text = np.char.rstrip(np.char.mod("%.4f", np.asarray(values, dtype=np.float64)), "0")
+    return np.where(np.char.endswith(text, "."), np.char.add(text, "0"), text)
 
 
 @app.route("/api/export/csv")
 def api_export_csv():
     """Full time-series CSV export (key Mesa advantage — TSX can't do this)."""
-    history = get_model().get_history()
-    if not history.get("round"):
-        return jsonify({"error": "No data yet — run some steps first"}), 400
-
-    output = io.StringIO()
-    columns = list(history.keys())
-    writer = csv.writer(output)
-    writer.writerow(columns)
-
-    n_rows = len(history[columns[0]])
-    for i in range(n_rows):
-        writer.writerow([
-            round(history[col][i], 4) if isinstance(history[col][i], float) else history[col][i]
-            for col in columns
-        ])
-
-    output.seek(0)
-    return output.getvalue(), 200, {
-        "Content-Type": "text/csv",
+    session = get_session()
+    with session.lock:
+        history = session.cached("history", get_model().get_history)
+        if not history.get("round"):
+            return jsonify({"error": "No data yet — run some steps first"}), 400
+
+        # Format whole columns in numpy (float columns to 4 dp, the rest
+        # as-is) — a snapshot taken under the lock, so a step can't land mid-export
+        columns = list(history.keys())
+        n_rows = len(history[columns[0]])
+        cells = [
+            (_format_4dp(values) if isinstance(values[0], float) else np.asarray(values).astype(str)).tolist()
+            for values in history.values()
+        ]
+
+    def generate():
+        # A block of rows at a time — the client starts downloading straight away
+        yield ",".join(columns) + "\r\n"
+        for start in range(0, n_rows, CSV_BLOCK_ROWS):
+            block = (col[start:start + CSV_BLOCK_ROWS] for col in cells)
+            yield "".join(",".join(row) + "\r\n" for row in zip(*block))
+
+    return Response(generate(), mimetype="text/csv", headers={
         "Content-Disposition": "attachment; filename=georgist_timeseries.csv",
-    }
+    })
+
+
+# Fixed-shape head of the /api/parcel response, formatted straight to JSON
+# (".2f" gives the same values as round(x, 2))
+_PARCEL_HEAD = (
+    '{{"id":{id},"row":{row},"col":{col},"environment_score":{env!r},'
+    '"community_score":{community:.2f},"market_value":{market:.2f},'
+)
 
 
 @app.route("/api/parcel/<int:parcel_id>")
 def api_parcel(parcel_id: int):
     """Single parcel details + event history."""
-    if not (0 <= parcel_id < 100):
-        return jsonify({"error": "Parcel ID must be 0–99"}), 400
-    m = get_model()
-    parcel = m.parcels[parcel_id]
-    row, col = m._index_to_coords(parcel_id)
-    return jsonify({
-        "id": parcel_id,
-        "row": row,
-        "col": col,
-        "environment_score": parcel.environment_score,
-        "community_score": round(parcel.community_score, 2),
-        "market_value": round(m._weighted_value(parcel_id), 2),
-        "lease_price": parcel.lease_price,
-        "rounds_vacant": parcel.rounds_vacant,
-        "occupant": {
-            "id": parcel.occupant.id,
-            "wealth": parcel.occupant.wealth,
-            "lease_expires": parcel.occupant.lease_expires,
-        } if parcel.occupant else None,
-        "history": parcel.history[-50:],  # last 50 events
-    })
+    if parcel_id >= N_PARCELS:   # the int converter already rejects negatives
+        return jsonify({"error": f"Parcel ID must be 0–{N_PARCELS - 1}"}), 400
+    session = get_session()
+    with session.lock:
+        m = get_model()
+        parcel = m.parcels[parcel_id]
+        row, col = divmod(parcel_id, GRID_SIZE)
+        head = _PARCEL_HEAD.format(
+            id=parcel_id, row=row, col=col,
+            env=float(m.env_scores[parcel_id]),
+            community=float(m.community_scores[parcel_id]),
+            market=float(m.market_values[parcel_id]),
+        )
+        # Variable-shape fields go through the JSON provider; drop its "{" and splice
+        tail = app.json.dumps({
+            "lease_price": parcel.lease_price,
+            "rounds_vacant": parcel.rounds_vacant,
+            "occupant": {
+                "id": parcel.occupant.id,
+                "wealth": parcel.occupant.wealth,
+                "lease_expires": parcel.occupant.lease_expires,
+            } if parcel.occupant else None,
+            "history": m.events.for_parcel(parcel_id),  # last PARCEL_HISTORY_LEN events
+        })
+    return app.response_class(head + tail[1:], mimetype="application/json")
+
+
+# filename → (mtime, summary); only new or rewritten run files are parsed again
+_runs_index: dict[str, tuple[float, dict]] = {}
+
+
+def _run_summary(path: Path) -> dict:
+    """Listing fields from one saved run manifest (or legacy run file)."""
+    data = _read_run(path)
+    return {
+        "id": _run_id(path.name),
+        "scenario_id": data["scenario_id"],
+        "scenario_title": data["scenario_title"],
+        "timestamp": data["timestamp"],
+        "rounds": data["rounds"],
+        "final_gini": data["final_stats"].get("gini_coefficient"),
+        "final_housing_rate": data["final_stats"].get("housing_rate"),
+        "final_population": data["final_stats"].get("population"),
+    }
 
 
 @app.route("/api/runs")
 def api_runs():
-    """List all saved prior runs, newest first."""
+    """
+    List saved prior runs, newest first. ?limit=K returns only the newest K
+    (run ids start with their timestamp, so filenames order by age).
+    """
+    limit = request.args.get("limit", type=int)
     RESULTS_DIR.mkdir(exist_ok=True)
-    runs = []
-    for f in sorted(RESULTS_DIR.glob("*.json"), reverse=True):
+    with os.scandir(RESULTS_DIR) as it:
+        entries = {entry.name: entry for entry in it if _is_run_file(entry.name)}
+
+    # Forget pruned files
+    for name in _runs_index.keys() - entries.keys():
+        _runs_index.pop(name, None)
+
+    if limit is not None:
+        names = heapq.nlargest(max(0, limit), entries)
+    else:
+        names = sorted(entries, reverse=True)
+
+    summaries = []
+    for name in names:
+        entry = entries[name]
         try:
-            with open(f) as fh:
-                data = json.load(fh)
-            runs.append({
-                "id": data["id"],
-                "scenario_id": data["scenario_id"],
-                "scenario_title": data["scenario_title"],
-                "timestamp": data["timestamp"],
-                "rounds": data["rounds"],
-                "final_gini": data["final_stats"].get("gini_coefficient"),
-                "final_housing_rate": data["final_stats"].get("housing_rate"),
-                "final_population": data["final_stats"].get("population"),
-            })
+            mtime = entry.stat().st_mtime
+            cached = _runs_index.get(name)
+            if cached is None or cached[0] != mtime:
+                cached = _runs_index[name] = (mtime, _run_summary(Path(entry.path)))
         except Exception:
             continue
-    return jsonify(runs)
+        summaries.append(cached[1])
+    return jsonify(summaries)
 
 
 @app.route("/api/runs/<run_id>")
 def api_run_detail(run_id: str):
     """Retrieve full history for a saved run."""
     # Sanitize — only allow filename characters
-    safe_id = Path(run_id).name
-    path = RESULTS_DIR / safe_id
-    if not path.exists():
+    safe_id = _run_id(Path(run_id).name)
+    for path in (RESULTS_DIR / f"{safe_id}.json", RESULTS_DIR / f"{safe_id}{LEGACY_RUN_SUFFIX}"):
+        if path.exists():
+            break
+    else:
+        return jsonify({"error": "Run not found"}), 404
+    try:
+        run = _read_run(path)
+        if "history" not in run:   # a manifest — its time series is in <id>.npz
+            with np.load(RESULTS_DIR / f"{safe_id}.npz") as columns:
+                run["history"] = {col: columns[col].tolist() for col in columns.files}
+    except (OSError, ValueError):
+        # Pruned between the listing and now, or unreadable
         return jsonify({"error": "Run not found"}), 404
-    with open(path) as f:
-        return jsonify(json.load(f))
+    run["id"] = safe_id
+    return jsonify(run)
 
 
 @app.route("/api/defaults")
 def api_defaults():
-    return jsonify(DEFAULT_PARAMS)
+    return _conditional(
+        _DEFAULTS_ETAG, lambda: app.response_class(_DEFAULTS_JSON, mimetype="application/json"),
+    )
 
 
 # =============================================================================
@@ -285,7 +715,6 @@ def api_defaults():
 # =============================================================================
 
 if __name__ == "__main__":
-    get_model()
     print("=" * 58)
     print("  Georgist Land Value Simulation")
     print("  Python/Mesa replica of Jane's TSX prototype")
@@ -0,0 +1,68 @@
+"""
+Optional Numba versions of GeorgistModel's per-round metrics and auctions.
+
+Importing this module requires numba; model.py falls back to the
+pure-Python functions (_gini, _run_auctions) when it is missing. Wealths
+are whole numbers, so the sums are exact and fastmath reordering cannot
+change a result.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def gini_nb(values):
+    """model._gini over a float64 array (sorted in place)."""
+    n = values.size
+    if n <= 1:
+        return 0.0
+    values.sort()
+    cumsum = 0.0
+    total = 0.0
+    for i in range(n):
+        v = values[i]
+        cumsum += (i + 1) * v
+        total += v
+    if total == 0:
+        return 0.0
+    return (2 * cumsum) / (n * total) - (n + 1) / n
+
+
+@njit(cache=True)
+def run_auctions_nb(lot_mv, lot_defender, wealth, slot):
+    """model._run_auctions over arrays; returns (winners, prices, placed) arrays."""
+    n_entries = wealth.size
+    placed = np.zeros(n_entries, dtype=np.bool_)
+    winners = np.full(lot_mv.size, -1, dtype=np.int64)
+    prices = np.full(lot_mv.size, np.nan)
+    head = 0
+
+    for li in range(lot_mv.size):
+        market_value = lot_mv[li]
+        defender = lot_defender[li]
+        while head < n_entries and placed[slot[head]]:
+            head += 1
+        if head == n_entries or wealth[head] < market_value:
+            continue
+
+        if defender < 0:
+            winner, price = slot[head], market_value
+        else:
+            k = head
+            while k < n_entries and (placed[slot[k]] or slot[k] == defender):
+                k += 1
+            if k == n_entries or wealth[k] < market_value:
+                winner, price = defender, market_value
+            elif wealth[k] > wealth[defender]:
+                winner, price = slot[k], max(market_value, wealth[defender] + 1.0)
+            elif wealth[k] == wealth[defender]:
+                winner, price = defender, wealth[k]
+            else:
+                winner, price = defender, max(market_value, wealth[k] + 1.0)
+
+        winners[li] = winner
+        prices[li] = price
+        placed[winner] = True
+
+    return winners, prices, placed
@@ -6,17 +6,18 @@ Matches Jane's specification:
 - No complex behaviors — agents are passive participants in auctions
 """
 
+import math
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Leaseholder:
     """
     An economic actor seeking housing.
 
     Attributes:
-        id: Unique identifier (format: r{round}-a{idx}-{random})
+        id: Unique identifier (format: r{round}-a{idx}-{creation counter})
         wealth: Bidding capacity (1 to max_wealth)
         round_entered: Immigration round
         lease_start: Round current lease began (None if unhoused)
@@ -47,25 +48,58 @@ class Leaseholder:
         self.lease_length = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParcelState:
     """
     State of a single parcel on the 10×10 grid.
 
+    Scores, lease price and vacancy count are stored in the model's parcel
+    arrays (env_scores, community_scores, lease_prices, rounds_vacant) at
+    `index`; the properties
+    below read and write that slot. Events are kept in the model's
+    EventLog (src/events.py), not on the parcel.
+
     Attributes:
-        environment_score: Fixed value based on column (1–10)
-        community_score: Dynamic value based on neighbors (0–16)
+        index: Row-major grid index (row * 10 + col)
+        arrays: Owner of the parcel arrays (the model)
         occupant: Current leaseholder or None
-        lease_price: Price locked at lease formation
-        rounds_vacant: Consecutive rounds without occupant
-        history: Event log for this parcel
     """
-    environment_score: float
-    community_score: float = 0.0
+    index: int
+    arrays: Any = field(repr=False, compare=False)
     occupant: Optional[Leaseholder] = None
-    lease_price: Optional[float] = None
-    rounds_vacant: int = 0
-    history: list = field(default_factory=list)
+
+    @property
+    def environment_score(self) -> float:
+        """Fixed value based on column (1–10)"""
+        return float(self.arrays.env_scores[self.index])
+
+    @property
+    def community_score(self) -> float:
+        """Dynamic value based on neighbors (0–16)"""
+        return float(self.arrays.community_scores[self.index])
+
+    @community_score.setter
+    def community_score(self, value: float) -> None:
+        self.arrays.community_scores[self.index] = value
+
+    @property
+    def lease_price(self) -> Optional[float]:
+        """Price locked at lease formation (None if no lease; NaN in the array)"""
+        price = float(self.arrays.lease_prices[self.index])
+        return None if math.isnan(price) else price
+
+    @lease_price.setter
+    def lease_price(self, value: Optional[float]) -> None:
+        self.arrays.lease_prices[self.index] = math.nan if value is None else value
+
+    @property
+    def rounds_vacant(self) -> int:
+        """Consecutive rounds without occupant"""
+        return int(self.arrays.rounds_vacant[self.index])
+
+    @rounds_vacant.setter
+    def rounds_vacant(self, value: int) -> None:
+        self.arrays.rounds_vacant[self.index] = value
 
     @property
     def market_value(self) -> float:
@@ -80,10 +114,3 @@ class ParcelState:
     @property
     def is_vacant(self) -> bool:
         return self.occupant is None
-
-    def add_event(self, round_num: int, event_type: str, details: dict) -> None:
-        self.history.append({
-            "round": round_num,
-            "type": event_type,
-            "details": details,
-        })
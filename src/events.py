@@ -0,0 +1,139 @@
+"""
+Parcel event log for the Georgist Land Value Simulation.
+
+One model-level ring buffer of parallel columns replaces a dict per event
+on each parcel. Events are stored as scalars; the {"round", "type",
+"details"} dicts the dashboard shows are only built for the parcel being
+looked at.
+"""
+
+import math
+
+import numpy as np
+
+# Events kept per parcel — older ones drop off as new ones arrive
+PARCEL_HISTORY_LEN = 50
+
+# Events kept in total (about 330 rounds at the busiest)
+EVENT_LOG_CAPACITY = 1 << 16
+
+# Rows allocated by the first log(); the columns double from there up to
+# the capacity, so a model that never logs (the array path) allocates none
+EVENT_LOG_INITIAL = 1024
+
+# Event type → the detail fields it reports, in display order
+EVENT_FIELDS = {
+    "lease_expired": ("agent_id", "agent_wealth", "lease_price", "market_value"),
+    "priced_out": ("agent_id", "market_value"),
+    "auction_won": ("agent_id", "agent_wealth", "lease_price", "market_value", "lease_length"),
+    "occupied": ("agent_id", "agent_wealth", "lease_price", "market_value", "lease_length"),
+}
+EVENT_TYPES = tuple(EVENT_FIELDS)
+_TYPE_IDS = {name: i for i, name in enumerate(EVENT_TYPES)}
+
+# Column name → dtype
+_COLUMNS = (
+    ("round", np.int32),
+    ("parcel", np.int16),
+    ("type", np.int8),
+    ("agent_id", object),
+    ("agent_wealth", np.int64),
+    ("lease_price", np.float64),
+    ("market_value", np.float64),
+    ("lease_length", np.int32),
+)
+
+
+class EventLog:
+    """
+    Append-only ring buffer of parcel events, one NumPy column per field.
+    Once `capacity` events have been logged the oldest are overwritten.
+    Fields an event type doesn't report hold -1 / NaN.
+
+    The columns start empty and grow geometrically (see EVENT_LOG_INITIAL)
+    until they reach `capacity`; only then does the ring wrap.
+    """
+
+    def __init__(self, capacity: int = EVENT_LOG_CAPACITY):
+        self.capacity = capacity
+        self.count = 0   # events logged so far; the next goes in slot count % capacity
+        for name, dtype in _COLUMNS:
+            setattr(self, name, np.empty(0, dtype=dtype))
+
+    def _reserve(self, n: int) -> None:
+        """Grow the columns, if need be, to hold `n` more events (never past capacity)."""
+        size = self.round.size
+        needed = min(self.count + n, self.capacity)
+        if needed <= size:
+            return
+        new_size = min(self.capacity, max(needed, 2 * size, EVENT_LOG_INITIAL))
+        for name, dtype in _COLUMNS:
+            column = np.empty(new_size, dtype=dtype)
+            column[:size] = getattr(self, name)
+            setattr(self, name, column)
+
+    def log(
+        self,
+        round_num: int,
+        parcel: int,
+        event_type: str,
+        agent_id: str,
+        market_value: float,
+        agent_wealth: int = -1,
+        lease_price: float = math.nan,
+        lease_length: int = -1,
+    ) -> None:
+        if self.count >= self.round.size and self.round.size < self.capacity:
+            self._reserve(1)
+        slot = self.count % self.capacity
+        self.round[slot] = round_num
+        self.parcel[slot] = parcel
+        self.type[slot] = _TYPE_IDS[event_type]
+        self.agent_id[slot] = agent_id
+        self.agent_wealth[slot] = agent_wealth
+        self.lease_price[slot] = math.nan if lease_price is None else lease_price
+        self.market_value[slot] = market_value
+        self.lease_length[slot] = lease_length
+        self.count += 1
+
+    def extend(self, rows: np.ndarray, agent_ids: list) -> None:
+        """
+        Log events in bulk from the array path's event rows (columns as
+        soa.EV_*, agents as rows), with `agent_ids` the matching agent ids.
+        """
+        n = rows.shape[0]
+        self._reserve(n)
+        slots = (self.count + np.arange(n)) % self.capacity
+        self.round[slots] = rows[:, 0]
+        self.parcel[slots] = rows[:, 1]
+        self.type[slots] = rows[:, 2]
+        self.agent_id[slots] = agent_ids
+        self.agent_wealth[slots] = rows[:, 4]
+        self.lease_price[slots] = rows[:, 5]
+        self.market_value[slots] = rows[:, 6]
+        self.lease_length[slots] = rows[:, 7]
+        self.count += n
+
+    def for_parcel(self, parcel: int, limit: int = PARCEL_HISTORY_LEN) -> list:
+        """The parcel's most recent `limit` events still in the log, oldest first."""
+        size = min(self.count, self.capacity)
+        slots = (self.count - size + np.arange(size)) % self.capacity   # oldest → newest
+        slots = slots[self.parcel[slots] == parcel][-limit:] if limit else slots[:0]
+        return [self._event(int(s)) for s in slots]
+
+    def _event(self, slot: int) -> dict:
+        event_type = EVENT_TYPES[self.type[slot]]
+        values = {
+            "agent_id": self.agent_id[slot],
+            "agent_wealth": int(self.agent_wealth[slot]),
+            "lease_price": float(self.lease_price[slot]),
+            "market_value": float(self.market_value[slot]),
+            "lease_length": int(self.lease_length[slot]),
+        }
+        if math.isnan(values["lease_price"]):
+            values["lease_price"] = None
+        return {
+            "round": int(self.round[slot]),
+            "type": event_type,
+            "details": {name: values[name] for name in EVENT_FIELDS[event_type]},
+        }
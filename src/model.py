@@ -5,18 +5,27 @@ Replicates Jane's React/TSX prototype in Mesa 3.
 Faithfully implements her 7-step round pipeline and 5-outcome auction.
 
 Mesa advantages over TSX:
-- DataCollector: Gini coefficient, housing rate, avg wealth tracked over all rounds
+- Time-series history: Gini coefficient, housing rate, avg wealth tracked over all rounds
+  (mirrored into a Mesa DataCollector with collect_mesa=True)
 - Seed param for reproducible runs
 - CSV export of full time-series (not just current snapshot)
 """
 
+import math
 import mesa
-import random
-import string
+import numpy as np
+from numpy.random import default_rng
 from typing import Optional, List, Dict, Any
 
 from .agents import Leaseholder, ParcelState
 from .constants import DEFAULT_PARAMS
+from .events import EventLog
+from .soa import EV_AGENT, EVENT_COLUMNS, community_scores
+
+try:
+    from ._fastmath import gini_nb, run_auctions_nb
+except ImportError:   # numba not installed — pure-Python _gini / _run_auctions below
+    gini_nb = run_auctions_nb = None
 
 
 def _gini(values: List[float]) -> float:
@@ -32,6 +41,63 @@ def _gini(values: List[float]) -> float:
     return (2 * cumsum) / (n * total) - (n + 1) / n
 
 
+# Per-round metrics, in the column order of GeorgistModel.history and the
+# array paths' history rows (src/soa.py, src/model_jit.py)
+HISTORY_COLUMNS = (
+    "round", "housing_rate", "unhoused_count", "population",
+    "avg_land_value", "avg_lease_price",
+    "avg_wealth_housed", "avg_wealth_unhoused", "gini_coefficient",
+)
+
+
+def _run_auctions(lot_mv: List[float], lot_defender: List[int], wealth: List[int], slot: List[int]):
+    """
+    Settle every lot in order (see GeorgistModel's auction rules).
+
+    Lots are sorted by market value and entries by wealth, both descending;
+    lot_defender and slot hold entry slots (-1 = no defender). Returns the
+    winning slot (-1 = nobody could afford the lot) and price per lot, and
+    the placed flag per slot. Same algorithm as _fastmath.run_auctions_nb.
+    """
+    n_entries = len(wealth)
+    placed = [False] * n_entries
+    winners = [-1] * len(lot_mv)
+    prices = [math.nan] * len(lot_mv)
+    head = 0   # first unplaced entry — placements never undo, so it only moves forward
+
+    for li, (market_value, defender) in enumerate(zip(lot_mv, lot_defender)):
+        while head < n_entries and placed[slot[head]]:
+            head += 1
+        # The first unplaced entry is the wealthiest: if it can't afford
+        # the lot, nobody can
+        if head == n_entries or wealth[head] < market_value:
+            continue
+
+        if defender < 0:
+            # Vacant lot — wealthiest eligible wins at market value
+            winner, price = slot[head], market_value
+        else:
+            # Challenger: wealthiest eligible entry that isn't the defender
+            k = head
+            while k < n_entries and (placed[slot[k]] or slot[k] == defender):
+                k += 1
+            if k == n_entries or wealth[k] < market_value:
+                # No challenger — defender keeps at market value
+                winner, price = defender, market_value
+            elif wealth[k] > wealth[defender]:
+                winner, price = slot[k], max(market_value, wealth[defender] + 1)
+            elif wealth[k] == wealth[defender]:
+                winner, price = defender, float(wealth[k])
+            else:
+                winner, price = defender, max(market_value, wealth[k] + 1)
+
+        winners[li] = winner
+        prices[li] = price
+        placed[winner] = True
+
+    return winners, prices, placed
+
+
 class GeorgistModel(mesa.Model):
     """
     Georgist Land Value Simulation.
@@ -43,7 +109,7 @@ class GeorgistModel(mesa.Model):
     4. Collect agents (expired + unhoused + immigrants), sort by wealth
     5. Sort parcels by market value (highest first)
     6. Run auctions
-    7. Final score recalc + DataCollector
+    7. Final score recalc + history row
 
     Auction (5 outcomes, Jane's spec):
     - Vacant lot → wealthiest eligible wins at market_value
@@ -63,9 +129,9 @@ class GeorgistModel(mesa.Model):
         environment_weight: float = DEFAULT_PARAMS["environment_weight"],
         community_weight: float = DEFAULT_PARAMS["community_weight"],
         seed: Optional[int] = None,
+        collect_mesa: bool = False,
     ):
-        import numpy as np
-        rng = np.random.default_rng(seed) if seed is not None else np.random.default_rng()
+        rng = default_rng(seed)   # seed=None draws fresh OS entropy
         super().__init__(rng=rng)
 
         self.immigration_rate = immigration_rate
@@ -79,126 +145,132 @@ class GeorgistModel(mesa.Model):
         self.grid_width = 10
         self.grid_height = 10
 
-        # Initialize parcels (row-major: index = row * 10 + col)
-        self.parcels: List[ParcelState] = []
-        for row in range(self.grid_height):
-            for col in range(self.grid_width):
-                env_score = col + 1  # Column 0→1, column 9→10 (Jane's spec)
-                self.parcels.append(ParcelState(environment_score=env_score))
+        # Parcel arrays (row-major: index = row * 10 + col); ParcelState
+        # objects are views onto one slot of each
+        n_parcels = self.grid_width * self.grid_height
+        # Column 0→1, column 9→10 (Jane's spec)
+        self.env_scores = (np.arange(n_parcels) % self.grid_width + 1).astype(np.float64)
+        self.community_scores = np.zeros(n_parcels)
+        self.lease_prices = np.full(n_parcels, np.nan)   # NaN = no lease
+        self.occupied = np.zeros(n_parcels, dtype=bool)  # kept in step with parcel.occupant
+        self.rounds_vacant = np.zeros(n_parcels, dtype=np.int64)
+        self.occupant_wealth = np.zeros(n_parcels, dtype=np.int64)   # 0 where vacant
+        self._rows = [i // self.grid_width for i in range(n_parcels)]
+        self._cols = [i % self.grid_width for i in range(n_parcels)]
+        self._max_weighted = 10 * environment_weight + 16 * community_weight
+        self._refresh_market_values()
+        self.parcels: List[ParcelState] = [ParcelState(index=i, arrays=self) for i in range(n_parcels)]
 
         self.housed_agents: Dict[int, Leaseholder] = {}   # parcel_index → agent
         self.unhoused_agents: List[Leaseholder] = []
+        self.unhoused_wealth = np.zeros(0, dtype=np.int64)   # parallel to unhoused_agents
+        self.events = EventLog()   # per-parcel events (object path only — see src/soa.py)
         self.current_round = 0
+        self._agent_counter = 0   # agents created so far (see _new_agent_id)
 
-        self.datacollector = mesa.DataCollector(
-            model_reporters={
-                "round": lambda m: m.current_round,
-                "housing_rate": lambda m: len(m.housed_agents) / 100,
-                "unhoused_count": lambda m: len(m.unhoused_agents),
-                "population": lambda m: len(m.housed_agents) + len(m.unhoused_agents),
-                "avg_land_value": lambda m: m._mean_market_value(),
-                "avg_lease_price": lambda m: m._mean_lease_price(),
-                "avg_wealth_housed": lambda m: m._avg_wealth(housed=True),
-                "avg_wealth_unhoused": lambda m: m._avg_wealth(housed=False),
-                "gini_coefficient": lambda m: m._gini_all_agents(),
-            }
-        )
-
-    # =========================================================================
-    # Grid utilities
-    # =========================================================================
-
-    def _index_to_coords(self, index: int):
-        return index // self.grid_width, index % self.grid_width
-
-    def _coords_to_index(self, row: int, col: int) -> int:
-        return row * self.grid_width + col
-
-    def _is_valid(self, row: int, col: int) -> bool:
-        return 0 <= row < self.grid_height and 0 <= col < self.grid_width
+        # Time series, one entry per round in each column (see _collect)
+        self.history: Dict[str, list] = {col: [] for col in HISTORY_COLUMNS}
+        # Mesa's DataCollector only on request (collect_mesa=True); it mirrors self.history
+        self.datacollector = mesa.DataCollector(model_reporters={
+            col: (lambda m, col=col: m.history[col][-1]) for col in HISTORY_COLUMNS
+        }) if collect_mesa else None
 
     # =========================================================================
     # Community score (Jane's 2-ring algorithm)
     # =========================================================================
 
-    def _calc_community_score(self, idx: int) -> float:
-        row, col = self._index_to_coords(idx)
-        score = 0.0
-        # Ring 1: 8 immediate neighbours, +1 each
-        for dr in [-1, 0, 1]:
-            for dc in [-1, 0, 1]:
-                if dr == 0 and dc == 0:
-                    continue
-                nr, nc = row + dr, col + dc
-                if self._is_valid(nr, nc) and not self.parcels[self._coords_to_index(nr, nc)].is_vacant:
-                    score += 1.0
-        # Ring 2: outer ring up to 16 cells, +0.5 each
-        for dr in [-2, -1, 0, 1, 2]:
-            for dc in [-2, -1, 0, 1, 2]:
-                if abs(dr) <= 1 and abs(dc) <= 1:
-                    continue
-                nr, nc = row + dr, col + dc
-                if self._is_valid(nr, nc) and not self.parcels[self._coords_to_index(nr, nc)].is_vacant:
-                    score += 0.5
-        return score
-
     def _update_all_community_scores(self) -> None:
-        for i, parcel in enumerate(self.parcels):
-            parcel.community_score = self._calc_community_score(i)
+        """One 5×5 convolution of the occupancy grid (soa.COMMUNITY_KERNEL)."""
+        self.community_scores[:] = community_scores(self.occupied)
+        self._refresh_market_values()
 
     # =========================================================================
     # Value calculations
     # =========================================================================
 
+    def _refresh_market_values(self) -> None:
+        """Weighted value of every parcel; call whenever community_scores change."""
+        self.market_values = self.env_scores * self.environment_weight + self.community_scores * self.community_weight
+
     def _weighted_value(self, idx: int) -> float:
-        p = self.parcels[idx]
-        return p.environment_score * self.environment_weight + p.community_score * self.community_weight
+        return float(self.market_values[idx])
 
     def _max_weighted_value(self) -> float:
-        return 10 * self.environment_weight + 16 * self.community_weight
+        return self._max_weighted
 
     # =========================================================================
     # Metrics
     # =========================================================================
 
+    # Sums run left to right over .tolist() so the float rounding matches
+    # the per-parcel loops these replaced (and soa._record)
+
     def _mean_lease_price(self) -> float:
-        prices = [p.lease_price for p in self.parcels if p.lease_price is not None]
+        # Exactly the occupied parcels hold a lease price (the rest are NaN)
+        prices = self.lease_prices[self.occupied].tolist()
         return sum(prices) / len(prices) if prices else 0.0
 
     def _mean_market_value(self) -> float:
-        return sum(self._weighted_value(i) for i in range(100)) / 100
+        return sum(self.market_values.tolist()) / 100
+
+    def _population_wealth(self) -> np.ndarray:
+        """Wealth of every agent, housed first (one entry per lease, like housed_agents)."""
+        return np.concatenate([self.occupant_wealth[self.occupied], self.unhoused_wealth])
 
     def _avg_wealth(self, housed: bool) -> float:
-        if housed:
-            agents = list(self.housed_agents.values())
-        else:
-            agents = self.unhoused_agents
-        if not agents:
+        wealth = self.occupant_wealth[self.occupied] if housed else self.unhoused_wealth
+        if not wealth.size:
             return 0.0
-        return sum(a.wealth for a in agents) / len(agents)
+        return int(wealth.sum()) / wealth.size
 
     def _gini_all_agents(self) -> float:
-        all_agents = list(self.housed_agents.values()) + self.unhoused_agents
-        if not all_agents:
+        wealth = self._population_wealth().astype(np.float64)
+        if not wealth.size:
             return 0.0
-        return _gini([float(a.wealth) for a in all_agents])
+        if gini_nb is not None:
+            return gini_nb(wealth)
+        return _gini(wealth.tolist())
+
+    def _collect(self) -> None:
+        """Append this round's metrics to self.history (and the DataCollector, if kept)."""
+        n_housed = len(self.housed_agents)
+        n_unhoused = len(self.unhoused_agents)
+        row = (
+            self.current_round,
+            n_housed / 100,
+            n_unhoused,
+            n_housed + n_unhoused,
+            self._mean_market_value(),
+            self._mean_lease_price(),
+            self._avg_wealth(housed=True),
+            self._avg_wealth(housed=False),
+            self._gini_all_agents(),
+        )
+        for values, value in zip(self.history.values(), row):
+            values.append(value)
+        if self.datacollector is not None:
+            self.datacollector.collect(self)
 
     # =========================================================================
     # Agent creation
     # =========================================================================
 
-    def _new_agent_id(self, idx: int) -> str:
-        suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=9))
-        return f"r{self.current_round}-a{idx}-{suffix}"
+    def _new_agent_id(self, idx: int, round_num: int) -> str:
+        # Agents are created in the same order on the object and array paths,
+        # so a seeded run gets the same ids either way
+        self._agent_counter += 1
+        return f"r{round_num}-a{idx}-{self._agent_counter:09d}"
 
     def _create_immigrants(self) -> List[Leaseholder]:
+        # One vectorised draw per round from the seeded numpy Generator
+        wealths = self.rng.integers(1, self.max_wealth + 1, size=self.immigration_rate)
         return [
             Leaseholder(
-                id=self._new_agent_id(i),
-                wealth=random.randint(1, self.max_wealth),
+                id=self._new_agent_id(i, self.current_round),
+                wealth=int(w),
                 round_entered=self.current_round,
             )
-            for i in range(self.immigration_rate)
+            for i, w in enumerate(wealths)
         ]
 
     # =========================================================================
@@ -212,193 +284,316 @@ class GeorgistModel(mesa.Model):
         self._update_all_community_scores()
 
         # Step 2: Vacancy counters
-        for parcel in self.parcels:
-            if parcel.is_vacant:
-                parcel.rounds_vacant += 1
-            else:
-                parcel.rounds_vacant = 0
-
-        # Step 3: Identify expired leases
-        expired_agents = []
-        lots_for_auction = []
-        expired_indices = set()
-
-        for idx, parcel in enumerate(self.parcels):
-            if parcel.occupant is not None and parcel.occupant.lease_expires == self.current_round:
+        self.rounds_vacant[~self.occupied] += 1
+        self.rounds_vacant[self.occupied] = 0
+
+        # Step 3: Identify expired leases. Lots are parallel columns: parcel
+        # index, market value, defender (expired lots first, then vacant ones)
+        expired_idx = []
+        defenders = []
+        market_values = self.market_values.tolist()
+        vacant_idx = np.flatnonzero(~self.occupied)   # before expiries: the lots with no defender
+
+        for idx in np.flatnonzero(self.occupied).tolist():
+            parcel = self.parcels[idx]
+            if parcel.occupant.lease_expires == self.current_round:
                 agent = parcel.occupant
-                expired_agents.append((agent, idx))
-                parcel.add_event(self.current_round, "lease_expired", {
-                    "agent_id": agent.id,
-                    "agent_wealth": agent.wealth,
-                    "lease_price": parcel.lease_price,
-                    "market_value": self._weighted_value(idx),
-                })
-                lots_for_auction.append({
-                    "index": idx,
-                    "market_value": self._weighted_value(idx),
-                    "defender": agent,
-                })
-                expired_indices.add(idx)
+                expired_idx.append(idx)
+                defenders.append(agent)
+                self.events.log(
+                    self.current_round, idx, "lease_expired", agent.id, market_values[idx],
+                    agent_wealth=agent.wealth, lease_price=parcel.lease_price,
+                )
                 self.housed_agents.pop(idx, None)
                 parcel.occupant = None
                 parcel.lease_price = None
-
-        # Vacant lots also go to auction
-        for idx, parcel in enumerate(self.parcels):
-            if parcel.is_vacant and idx not in expired_indices:
-                mv = self._weighted_value(idx)
-                if self.vacancy_decay and parcel.rounds_vacant > 0:
-                    mv = max(1.0, mv - parcel.rounds_vacant * 0.5)
-                lots_for_auction.append({
-                    "index": idx,
-                    "market_value": mv,
-                    "defender": None,
-                })
+                self.occupied[idx] = False
+                self.occupant_wealth[idx] = 0
+
+        # Vacant lots also go to auction, marked down for time on the market
+        vacant_mv = self.market_values[vacant_idx]
+        if self.vacancy_decay:
+            rounds_vacant = self.rounds_vacant[vacant_idx]
+            vacant_mv = np.where(rounds_vacant > 0, np.maximum(1.0, vacant_mv - rounds_vacant * 0.5), vacant_mv)
+        lot_idx = expired_idx + vacant_idx.tolist()
+        lot_mv = np.concatenate([self.market_values[expired_idx], vacant_mv])
+        lot_defender = defenders + [None] * vacant_idx.size
 
         # Step 4: Collect agents needing placement
-        agents_to_place = []
-        for agent, prev_idx in expired_agents:
-            agents_to_place.append({"agent": agent, "source": "expired_lease", "prev_idx": prev_idx})
-        for agent in self.unhoused_agents:
-            agents_to_place.append({"agent": agent, "source": "unhoused", "prev_idx": None})
+        agents_to_place = defenders + self.unhoused_agents + self._create_immigrants()
         self.unhoused_agents = []
-        for agent in self._create_immigrants():
-            agents_to_place.append({"agent": agent, "source": "immigrant", "prev_idx": None})
 
-        # Step 5 & 6: Sort then run auctions
-        lots_for_auction.sort(key=lambda x: x["market_value"], reverse=True)
-        agents_to_place.sort(key=lambda x: x["agent"].wealth, reverse=True)
-
-        placed_ids = set()
-
-        for lot in lots_for_auction:
-            idx = lot["index"]
-            market_value = lot["market_value"]
-            defender = lot["defender"]
-
-            eligible = [
-                e for e in agents_to_place
-                if e["agent"].id not in placed_ids
-                and e["agent"].wealth >= market_value
-            ]
+        # Step 5 & 6: Sort then run auctions. Entries are parallel lists
+        # (wealth-descending); lots come in market-value order. An agent whose
+        # leases on two parcels expire together has two entries; `slot` points
+        # both at its first, which stands for the agent.
+        # Both sorts are stable argsorts of the negated key, so ties keep
+        # their collection order as list.sort(reverse=True) would.
+        order = np.argsort(-lot_mv, kind="stable")
+        lot_mv = lot_mv[order]
+        lot_idx = [lot_idx[i] for i in order.tolist()]
+        lot_defender = [lot_defender[i] for i in order.tolist()]
+        wealth = np.array([a.wealth for a in agents_to_place], dtype=np.int64)
+        order = np.argsort(-wealth, kind="stable")
+        wealth = wealth[order]
+        agents_to_place = [agents_to_place[i] for i in order.tolist()]
+
+        position = {}
+        slot = [position.setdefault(id(a), k) for k, a in enumerate(agents_to_place)]
+        defender_slot = [position[id(d)] if d else -1 for d in lot_defender]
+        if run_auctions_nb is not None:
+            winners, prices, placed = (out.tolist() for out in run_auctions_nb(
+                lot_mv, np.array(defender_slot, dtype=np.int64),
+                wealth.astype(np.float64), np.array(slot, dtype=np.int64),
+            ))
+        else:
+            winners, prices, placed = _run_auctions(lot_mv.tolist(), defender_slot, wealth.tolist(), slot)
 
-            if not eligible:
+        won = []   # (parcel index, winner, lease price, market value, contested) in auction order
+        for idx, market_value, defender, winner_slot, lease_price in zip(
+            lot_idx, lot_mv.tolist(), lot_defender, winners, prices,
+        ):
+            if winner_slot < 0:
                 if defender:
-                    self.parcels[idx].add_event(self.current_round, "priced_out", {
-                        "agent_id": defender.id,
-                        "market_value": market_value,
-                    })
+                    self.events.log(self.current_round, idx, "priced_out", defender.id, market_value)
                 continue
 
-            winner, lease_price = self._run_auction(market_value, defender, eligible)
-
-            if winner:
-                lease_length = random.randint(self.min_lease_length, self.max_lease_length)
-                winner.assign_lease(self.current_round, lease_length)
-
-                parcel = self.parcels[idx]
-                parcel.occupant = winner
-                parcel.lease_price = lease_price
-                parcel.rounds_vacant = 0
-
-                self.housed_agents[idx] = winner
-                placed_ids.add(winner.id)
-
-                event_type = "auction_won" if defender else "occupied"
-                parcel.add_event(self.current_round, event_type, {
-                    "agent_id": winner.id,
-                    "agent_wealth": winner.wealth,
-                    "lease_price": lease_price,
-                    "market_value": market_value,
-                    "lease_length": lease_length,
-                })
+            winner = agents_to_place[winner_slot]
+            parcel = self.parcels[idx]
+            parcel.occupant = winner
+            parcel.lease_price = lease_price
+            self.occupied[idx] = True
+            self.occupant_wealth[idx] = winner.wealth
+            self.rounds_vacant[idx] = 0
+
+            self.housed_agents[idx] = winner
+            won.append((idx, winner, lease_price, market_value, defender is not None))
+
+        # Lease lengths for every winner in one draw — the same values, in the
+        # same order, as one draw per win (nothing above depends on them)
+        lease_lengths = self.rng.integers(self.min_lease_length, self.max_lease_length + 1, size=len(won))
+        for (idx, winner, lease_price, market_value, contested), lease_length in zip(won, lease_lengths.tolist()):
+            winner.assign_lease(self.current_round, lease_length)
+            self.events.log(
+                self.current_round, idx, "auction_won" if contested else "occupied", winner.id, market_value,
+                agent_wealth=winner.wealth, lease_price=lease_price, lease_length=lease_length,
+            )
 
         # Step 6 continued: unplaced → unhoused
-        for entry in agents_to_place:
-            if entry["agent"].id not in placed_ids:
-                entry["agent"].clear_lease()
-                self.unhoused_agents.append(entry["agent"])
+        for agent, k in zip(agents_to_place, slot):
+            if not placed[k]:
+                agent.clear_lease()
+                self.unhoused_agents.append(agent)
+        self.unhoused_wealth = np.array([a.wealth for a in self.unhoused_agents], dtype=np.int64)
 
-        # Step 7: Final recalc + DataCollector
+        # Step 7: Final recalc + history row
         self._update_all_community_scores()
-        self.datacollector.collect(self)
+        self._collect()
 
     # =========================================================================
-    # Auction
+    # Struct-of-arrays bridge (src/soa.py, src/model_jit.py)
     # =========================================================================
 
-    def _run_auction(
-        self,
-        market_value: float,
-        defender: Optional[Leaseholder],
-        eligible: List[dict],
-    ):
-        if not defender:
-            # Vacant lot — wealthiest eligible wins at market value
-            return eligible[0]["agent"], market_value
-
-        # Find challenger (wealthiest who is not the defender)
-        challenger_entry = next(
-            (e for e in eligible if e["agent"].id != defender.id), None
-        )
+    def to_soa(self, steps: int, events: bool = False) -> Dict[str, Any]:
+        """
+        Flatten parcels + agents into parallel NumPy arrays with room for
+        `steps` more rounds. Agents become rows; parcels hold an agent row
+        in `occupant` (-1 = vacant). With events=True parcel events are
+        kept too (at most as many as the EventLog holds).
+        """
+        agents: List[Leaseholder] = []
+        rows: Dict[int, int] = {}   # id(agent) → row
+
+        def row_of(agent: Leaseholder) -> int:
+            if id(agent) not in rows:
+                rows[id(agent)] = len(agents)
+                agents.append(agent)
+            return rows[id(agent)]
+
+        occupant = np.full(100, -1, dtype=np.int64)
+        for i, parcel in enumerate(self.parcels):
+            if parcel.occupant is not None:
+                occupant[i] = row_of(parcel.occupant)
+        unhoused_rows = [row_of(a) for a in self.unhoused_agents]
+
+        n = len(agents)
+        capacity = n + steps * self.immigration_rate
+        wealth = np.zeros(capacity, dtype=np.int64)
+        round_entered = np.zeros(capacity, dtype=np.int64)
+        lease_start = np.full(capacity, -1, dtype=np.int64)
+        lease_length = np.full(capacity, -1, dtype=np.int64)
+        for r, a in enumerate(agents):
+            wealth[r] = a.wealth
+            round_entered[r] = a.round_entered
+            if a.lease_start is not None:
+                lease_start[r] = a.lease_start
+                lease_length[r] = a.lease_length
+
+        # Unhoused rows are rewritten at the front each round, so the agent
+        # capacity (plus a round of duplicate defender entries) bounds them;
+        # soa.grow_unhoused() covers the rare run whose duplicates pile up
+        unhoused = np.zeros(max(capacity, len(unhoused_rows)) + 100, dtype=np.int64)
+        unhoused[:len(unhoused_rows)] = unhoused_rows
+
+        self._soa_agents = agents
+        return {
+            "rng": self.rng,
+            "params": (
+                int(self.immigration_rate), int(self.min_lease_length), int(self.max_lease_length),
+                int(self.max_wealth), bool(self.vacancy_decay),
+                float(self.environment_weight), float(self.community_weight),
+            ),
+            "env": self.env_scores.copy(),
+            "community": self.community_scores.copy(),
+            "occupant": occupant,
+            "lease_price": self.lease_prices.copy(),
+            "rounds_vacant": self.rounds_vacant.copy(),
+            "wealth": wealth,
+            "round_entered": round_entered,
+            "lease_start": lease_start,
+            "lease_length": lease_length,
+            "unhoused": unhoused,
+            # n_agents, n_unhoused, current_round, rounds_done, n_events
+            "counters": np.array([n, len(unhoused_rows), self.current_round, 0, 0], dtype=np.int64),
+            "history": np.zeros((steps, len(HISTORY_COLUMNS)), dtype=np.float64),
+            # Each round logs at most an expiry and an outcome per parcel
+            "events": np.empty((min(self.events.capacity, steps * 200) if events else 0, EVENT_COLUMNS)),
+        }
 
-        if not challenger_entry:
-            # No challenger — defender keeps at market value
-            return defender, market_value
+    def ingest_soa(self, soa: Dict[str, Any]) -> None:
+        """Write array state advanced by soa.step_soa_n back onto the model."""
+        wealth = soa["wealth"]
+        round_entered = soa["round_entered"]
+        lease_start = soa["lease_start"]
+        lease_length = soa["lease_length"]
+        occupant = soa["occupant"]
+        n_agents, n_unhoused, current_round, rounds_done, n_events = (int(c) for c in soa["counters"])
+        if soa["rng"] is not self.rng:
+            # Advanced in another process (soa.step_detached) — carry the stream position back
+            self.rng.bit_generator.state = soa["rng"].bit_generator.state
+
+        agents = self._soa_agents
+        n_existing = len(agents)
+        for r in range(n_existing, n_agents):
+            # Immigrants arrive in batches of immigration_rate per round
+            agents.append(Leaseholder(
+                id=self._new_agent_id((r - n_existing) % self.immigration_rate, int(round_entered[r])),
+                wealth=int(wealth[r]),
+                round_entered=int(round_entered[r]),
+            ))
+        for r, a in enumerate(agents):
+            if lease_start[r] >= 0:
+                a.assign_lease(int(lease_start[r]), int(lease_length[r]))
+            else:
+                a.clear_lease()
 
-        challenger = challenger_entry["agent"]
+        self.community_scores[:] = soa["community"]
+        self.lease_prices[:] = soa["lease_price"]
+        self.occupied[:] = occupant >= 0
+        self.rounds_vacant[:] = soa["rounds_vacant"]
+        self.occupant_wealth[:] = np.where(self.occupied, soa["wealth"][occupant], 0)
+        self.unhoused_wealth = soa["wealth"][soa["unhoused"][:n_unhoused]].astype(np.int64)
+        self._refresh_market_values()
 
-        if challenger.wealth > defender.wealth:
-            return challenger, max(market_value, defender.wealth + 1)
-        elif challenger.wealth == defender.wealth:
-            return defender, float(challenger.wealth)
-        else:
-            return defender, max(market_value, challenger.wealth + 1)
+        self.housed_agents = {}
+        for i, parcel in enumerate(self.parcels):
+            if occupant[i] >= 0:
+                parcel.occupant = agents[occupant[i]]
+                self.housed_agents[i] = parcel.occupant
+            else:
+                parcel.occupant = None
+        self.unhoused_agents = [agents[r] for r in soa["unhoused"][:n_unhoused]]
+
+        # Parcel events, oldest first, from the ring's last (up to) capacity
+        # rows; the ones it overwrote count as logged and overwritten
+        size = min(n_events, soa["events"].shape[0])
+        if size:
+            self.events.count += n_events - size
+            rows = soa["events"][(n_events - size + np.arange(size)) % soa["events"].shape[0]]
+            self.events.extend(rows, [agents[r].id for r in rows[:, EV_AGENT].astype(np.int64).tolist()])
+
+        self.current_round = current_round
+        self.steps += rounds_done
+        int_columns = {"round", "unhoused_count", "population"}
+        for k, col in enumerate(HISTORY_COLUMNS):
+            values = soa["history"][:rounds_done, k].tolist()
+            if col in int_columns:
+                values = [int(v) for v in values]
+            self.history[col].extend(values)
+            if self.datacollector is not None:
+                self.datacollector.model_vars[col].extend(values)
+        del self._soa_agents
 
     # =========================================================================
     # State export
     # =========================================================================
 
-    def get_state(self) -> Dict[str, Any]:
-        parcels_data = []
-        for i, parcel in enumerate(self.parcels):
-            row, col = self._index_to_coords(i)
-            wv = self._weighted_value(i)
-            display_val = parcel.lease_price if parcel.occupant and parcel.lease_price else wv
-            parcels_data.append({
-                "id": i,
-                "row": row,
-                "col": col,
-                "environment_score": parcel.environment_score,
-                "community_score": round(parcel.community_score, 2),
-                "market_value": round(wv, 2),
-                "display_value": round(display_val, 2),
-                "lease_price": round(parcel.lease_price, 2) if parcel.lease_price else None,
-                "rounds_vacant": parcel.rounds_vacant,
-                "occupant": {
-                    "id": parcel.occupant.id,
-                    "wealth": parcel.occupant.wealth,
-                    "lease_start": parcel.occupant.lease_start,
-                    "lease_length": parcel.occupant.lease_length,
-                    "lease_expires": parcel.occupant.lease_expires,
-                    "round_entered": parcel.occupant.round_entered,
-                } if parcel.occupant else None,
-            })
+    def get_state(self, columns: bool = False) -> Dict[str, Any]:
+        """
+        Snapshot for the dashboard. "parcels" is one dict per parcel; with
+        columns=True it is replaced by "parcel_values" (one list per parcel
+        field, indexed by parcel id) and "occupants" (parcel id → occupant,
+        occupied parcels only), which skips building 100 dicts per call.
+        """
+        # Whole arrays to Python values once, instead of per-parcel lookups
+        # (community scores are multiples of 0.5, so need no rounding)
+        occupied = self.occupied.tolist()
+        market_values = [round(v, 2) for v in self.market_values.tolist()]
+        lease_prices = [None if math.isnan(p) else round(p, 2) for p in self.lease_prices.tolist()]
+        values = {
+            "id": list(range(len(self.parcels))),
+            "row": self._rows,
+            "col": self._cols,
+            "environment_score": self.env_scores.tolist(),
+            "community_score": self.community_scores.tolist(),
+            "market_value": market_values,
+            "display_value": [
+                lease if occ and lease else mv for occ, lease, mv in zip(occupied, lease_prices, market_values)
+            ],
+            "lease_price": [lease if lease else None for lease in lease_prices],
+            "rounds_vacant": self.rounds_vacant.tolist(),
+        }
+        occupants = {
+            i: {
+                "id": agent.id,
+                "wealth": agent.wealth,
+                "lease_start": agent.lease_start,
+                "lease_length": agent.lease_length,
+                "lease_expires": agent.lease_expires,
+                "round_entered": agent.round_entered,
+            }
+            for i, agent in ((i, self.parcels[i].occupant) for i in np.flatnonzero(self.occupied).tolist())
+        }
+
+        if columns:
+            parcels = {
+                "parcel_values": values,
+                "occupants": {str(i): occupant for i, occupant in occupants.items()},
+            }
+        else:
+            parcels = {"parcels": [
+                {
+                    "id": i, "row": row, "col": col,
+                    "environment_score": env, "community_score": community,
+                    "market_value": market, "display_value": display, "lease_price": lease,
+                    "rounds_vacant": vacant, "occupant": occupants.get(i),
+                }
+                for i, row, col, env, community, market, display, lease, vacant in zip(*values.values())
+            ]}
 
         unhoused_data = [
             {"id": a.id, "wealth": a.wealth, "round_entered": a.round_entered}
             for a in self.unhoused_agents
         ]
 
-        all_agents = list(self.housed_agents.values()) + self.unhoused_agents
-        wealth_all = [a.wealth for a in all_agents]
+        wealth_all = self._population_wealth()
 
         return {
             "round": self.current_round,
-            "parcels": parcels_data,
+            **parcels,
             "unhoused": unhoused_data,
             "stats": {
-                "population": len(all_agents),
+                "population": int(wealth_all.size),
                 "housed": len(self.housed_agents),
                 "unhoused_count": len(self.unhoused_agents),
                 "housing_rate": round(len(self.housed_agents) / 100, 3),
@@ -407,8 +602,8 @@ class GeorgistModel(mesa.Model):
                 "avg_wealth_housed": round(self._avg_wealth(housed=True), 2),
                 "avg_wealth_unhoused": round(self._avg_wealth(housed=False), 2),
                 "gini_coefficient": round(self._gini_all_agents(), 3),
-                "max_wealth": max(wealth_all) if wealth_all else 0,
-                "min_wealth": min(wealth_all) if wealth_all else 0,
+                "max_wealth": int(wealth_all.max()) if wealth_all.size else 0,
+                "min_wealth": int(wealth_all.min()) if wealth_all.size else 0,
             },
             "params": {
                 "immigration_rate": self.immigration_rate,
@@ -423,13 +618,11 @@ class GeorgistModel(mesa.Model):
         }
 
     def get_history(self) -> Dict[str, Any]:
-        """Export DataCollector time-series as JSON."""
-        df = self.datacollector.get_model_vars_dataframe()
-        if df.empty:
-            return {col: [] for col in [
-                "round", "housing_rate", "unhoused_count", "population",
-                "avg_land_value", "avg_lease_price",
-                "avg_wealth_housed", "avg_wealth_unhoused", "gini_coefficient"
-            ]}
-        records = df.reset_index()
-        return {col: records[col].tolist() for col in records.columns}
+        """
+        Time series as JSON-ready lists. Once there is data, a leading
+        "index" column (0, 1, …) is included, as the DataFrame export had.
+        """
+        n_rows = len(self.history["round"])
+        if not n_rows:
+            return {col: [] for col in HISTORY_COLUMNS}
+        return {"index": list(range(n_rows)), **{col: list(values) for col, values in self.history.items()}}
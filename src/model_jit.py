@@ -0,0 +1,292 @@
+"""
+Numba-compiled stepping kernel for the Georgist Land Value Simulation.
+
+Runs the same 7-step pipeline and 5-outcome auction as GeorgistModel.step()
+over the struct-of-arrays layout from src/soa.py, so the whole round
+compiles to machine code. Random draws come from the model's own numpy
+Generator, so every path consumes the same stream.
+
+The grid shape (GRID_SIZE, N_PARCELS) is read from module globals, which
+numba freezes as compile-time constants, so the parcel loops are already
+specialised. Scenario params stay runtime arguments: baking them into a
+per-sweep-cell closure gave no measurable speedup and costs a multi-second
+compile per cell, where step_many compiles once and is cached on disk.
+
+Requires numba (optional dependency) — reached via soa.step_soa_n(jit=True):
+
+    from src.soa import advance
+    advance(m, steps, jit=True)
+"""
+
+import numpy as np
+from numba import njit
+
+from .soa import (
+    GRID_SIZE, N_PARCELS, N_AGENTS, N_UNHOUSED, ROUND, ROUNDS_DONE, N_EVENTS,
+    LEASE_EXPIRED, PRICED_OUT, AUCTION_WON, OCCUPIED,
+)
+
+
+@njit(cache=True)
+def _update_community_scores(occupant, community):
+    """Jane's 2-ring algorithm: +1 per ring-1 neighbour, +0.5 per ring-2."""
+    for idx in range(N_PARCELS):
+        row = idx // GRID_SIZE
+        col = idx % GRID_SIZE
+        score = 0.0
+        for dr in range(-1, 2):
+            for dc in range(-1, 2):
+                if dr == 0 and dc == 0:
+                    continue
+                nr, nc = row + dr, col + dc
+                if 0 <= nr < GRID_SIZE and 0 <= nc < GRID_SIZE and occupant[nr * GRID_SIZE + nc] >= 0:
+                    score += 1.0
+        for dr in range(-2, 3):
+            for dc in range(-2, 3):
+                if abs(dr) <= 1 and abs(dc) <= 1:
+                    continue
+                nr, nc = row + dr, col + dc
+                if 0 <= nr < GRID_SIZE and 0 <= nc < GRID_SIZE and occupant[nr * GRID_SIZE + nc] >= 0:
+                    score += 0.5
+        community[idx] = score
+
+
+@njit(cache=True)
+def _gini(values):
+    n = values.size
+    if n <= 1:
+        return 0.0
+    s = np.sort(values)
+    cumsum = 0.0
+    total = 0.0
+    for i in range(n):
+        cumsum += (i + 1) * s[i]
+        total += s[i]
+    if total == 0:
+        return 0.0
+    return (2 * cumsum) / (n * total) - (n + 1) / n
+
+
+@njit(cache=True)
+def _log_event(events, counters, round_num, parcel, event_type, agent, wealth,
+               lease_price, market_value, lease_length):
+    """One row into the `events` ring (columns as soa.EV_*); no-op when it has no rows."""
+    if events.shape[0] == 0:
+        return
+    row = events[counters[N_EVENTS] % events.shape[0]]
+    row[0] = round_num
+    row[1] = parcel
+    row[2] = event_type
+    row[3] = agent
+    row[4] = wealth
+    row[5] = lease_price
+    row[6] = market_value
+    row[7] = lease_length
+    counters[N_EVENTS] += 1
+
+
+@njit(cache=True)
+def _record(out, round_num, env, community, occupant, lease_price, wealth,
+            unhoused, n_unhoused, env_w, comm_w):
+    """One history row, column order as in model.HISTORY_COLUMNS."""
+    housed = 0
+    housed_wealth = 0.0
+    land_total = 0.0
+    lease_total = 0.0
+    n_leases = 0
+    for idx in range(N_PARCELS):
+        land_total += env[idx] * env_w + community[idx] * comm_w
+        if not np.isnan(lease_price[idx]):
+            lease_total += lease_price[idx]
+            n_leases += 1
+        if occupant[idx] >= 0:
+            housed += 1
+            housed_wealth += wealth[occupant[idx]]
+
+    all_wealth = np.empty(housed + n_unhoused, dtype=np.float64)
+    k = 0
+    for idx in range(N_PARCELS):
+        if occupant[idx] >= 0:
+            all_wealth[k] = wealth[occupant[idx]]
+            k += 1
+    unhoused_wealth = 0.0
+    for u in range(n_unhoused):
+        all_wealth[k] = wealth[unhoused[u]]
+        unhoused_wealth += wealth[unhoused[u]]
+        k += 1
+
+    out[0] = round_num
+    out[1] = housed / 100
+    out[2] = n_unhoused
+    out[3] = housed + n_unhoused
+    out[4] = land_total / 100
+    out[5] = lease_total / n_leases if n_leases else 0.0
+    out[6] = housed_wealth / housed if housed else 0.0
+    out[7] = unhoused_wealth / n_unhoused if n_unhoused else 0.0
+    out[8] = _gini(all_wealth) if k else 0.0
+
+
+@njit(cache=True)
+def step_many(rng, params, env, community, occupant, lease_price, rounds_vacant,
+              wealth, round_entered, lease_start, lease_length, unhoused,
+              counters, history, events, steps):
+    """
+    Advance the array state by `steps` rounds in place.
+
+    Agents are rows in the wealth / round_entered / lease_* arrays; parcels
+    hold an agent row in `occupant` (-1 = vacant). One history row is
+    written per round, and parcel events go to `events` if it has rows.
+    Returns early, before a round that could overflow `unhoused` (see
+    soa.unhoused_room); counters[ROUNDS_DONE] tells the caller how far it got.
+    """
+    immigration_rate, min_lease, max_lease, max_wealth, vacancy_decay, env_w, comm_w = params
+
+    lot_idx = np.empty(N_PARCELS, dtype=np.int64)
+    lot_mv = np.empty(N_PARCELS, dtype=np.float64)
+    lot_defender = np.empty(N_PARCELS, dtype=np.int64)
+    expired = np.zeros(N_PARCELS, dtype=np.bool_)
+    placed = np.zeros(wealth.size, dtype=np.bool_)
+    won_lot = np.empty(N_PARCELS, dtype=np.int64)   # lot of each win, in auction order
+    won_length = np.empty(N_PARCELS, dtype=np.int64)   # its lease length (a defender can win twice)
+
+    for _ in range(steps):
+        if counters[N_UNHOUSED] + N_PARCELS + immigration_rate > unhoused.size:
+            return
+        round_num = counters[ROUND] + 1
+        counters[ROUND] = round_num
+
+        # Step 1: Community scores
+        _update_community_scores(occupant, community)
+
+        # Step 2: Vacancy counters
+        for idx in range(N_PARCELS):
+            if occupant[idx] < 0:
+                rounds_vacant[idx] += 1
+            else:
+                rounds_vacant[idx] = 0
+
+        # Step 3: Identify expired leases
+        n_unhoused = counters[N_UNHOUSED]
+        entries = np.empty(N_PARCELS + n_unhoused + immigration_rate, dtype=np.int64)
+        n_entries = 0
+        n_lots = 0
+        expired[:] = False
+
+        for idx in range(N_PARCELS):
+            a = occupant[idx]
+            if a >= 0 and lease_start[a] >= 0 and lease_start[a] + lease_length[a] == round_num:
+                entries[n_entries] = a
+                n_entries += 1
+                lot_idx[n_lots] = idx
+                lot_mv[n_lots] = env[idx] * env_w + community[idx] * comm_w
+                lot_defender[n_lots] = a
+                n_lots += 1
+                _log_event(events, counters, round_num, idx, LEASE_EXPIRED, a, wealth[a],
+                           lease_price[idx], lot_mv[n_lots - 1], -1)
+                expired[idx] = True
+                occupant[idx] = -1
+                lease_price[idx] = np.nan
+
+        # Vacant lots also go to auction
+        for idx in range(N_PARCELS):
+            if occupant[idx] < 0 and not expired[idx]:
+                mv = env[idx] * env_w + community[idx] * comm_w
+                if vacancy_decay and rounds_vacant[idx] > 0:
+                    mv = max(1.0, mv - rounds_vacant[idx] * 0.5)
+                lot_idx[n_lots] = idx
+                lot_mv[n_lots] = mv
+                lot_defender[n_lots] = -1
+                n_lots += 1
+
+        # Step 4: Collect agents needing placement
+        for u in range(n_unhoused):
+            entries[n_entries] = unhoused[u]
+            n_entries += 1
+        n_unhoused = 0
+        for _i in range(immigration_rate):
+            a = counters[N_AGENTS]
+            counters[N_AGENTS] = a + 1
+            wealth[a] = rng.integers(1, max_wealth + 1)
+            round_entered[a] = round_num
+            lease_start[a] = -1
+            lease_length[a] = -1
+            entries[n_entries] = a
+            n_entries += 1
+
+        # Step 5 & 6: Sort (stable, descending) then run auctions
+        lot_order = np.argsort(-lot_mv[:n_lots], kind="mergesort")
+        entries = entries[:n_entries]
+        entries = entries[np.argsort(-wealth[entries], kind="mergesort")]
+        for e in range(n_entries):
+            placed[entries[e]] = False
+        n_won = 0
+
+        for li in lot_order:
+            idx = lot_idx[li]
+            market_value = lot_mv[li]
+            defender = lot_defender[li]
+
+            first = -1
+            challenger = -1
+            for e in range(n_entries):
+                a = entries[e]
+                if placed[a] or wealth[a] < market_value:
+                    continue
+                if first < 0:
+                    first = a
+                if a != defender:
+                    challenger = a
+                    break
+
+            if first < 0:
+                if defender >= 0:
+                    _log_event(events, counters, round_num, idx, PRICED_OUT, defender, -1,
+                               np.nan, market_value, -1)
+                continue
+
+            if defender < 0:
+                winner, price = first, market_value
+            elif challenger < 0:
+                winner, price = defender, market_value
+            elif wealth[challenger] > wealth[defender]:
+                winner, price = challenger, max(market_value, wealth[defender] + 1.0)
+            elif wealth[challenger] == wealth[defender]:
+                winner, price = defender, float(wealth[challenger])
+            else:
+                winner, price = defender, max(market_value, wealth[challenger] + 1.0)
+
+            lease_start[winner] = round_num
+            lease_length[winner] = rng.integers(min_lease, max_lease + 1)
+            occupant[idx] = winner
+            lease_price[idx] = price
+            rounds_vacant[idx] = 0
+            placed[winner] = True
+            won_lot[n_won] = li
+            won_length[n_won] = lease_length[winner]
+            n_won += 1
+
+        # Wins are logged after the round's priced-out defenders, as in GeorgistModel.step()
+        for w in range(n_won):
+            li = won_lot[w]
+            idx = lot_idx[li]
+            a = occupant[idx]
+            _log_event(events, counters, round_num, idx,
+                       AUCTION_WON if lot_defender[li] >= 0 else OCCUPIED, a, wealth[a],
+                       lease_price[idx], lot_mv[li], won_length[w])
+
+        # Step 6 continued: unplaced → unhoused
+        for e in range(n_entries):
+            a = entries[e]
+            if not placed[a]:
+                lease_start[a] = -1
+                lease_length[a] = -1
+                unhoused[n_unhoused] = a
+                n_unhoused += 1
+        counters[N_UNHOUSED] = n_unhoused
+
+        # Step 7: Final recalc + history row
+        _update_community_scores(occupant, community)
+        _record(history[counters[ROUNDS_DONE]], round_num, env, community, occupant,
+                lease_price, wealth, unhoused, n_unhoused, env_w, comm_w)
+        counters[ROUNDS_DONE] += 1
+
@@ -0,0 +1,310 @@
+"""
+Struct-of-arrays stepping for the Georgist Land Value Simulation.
+
+GeorgistModel.to_soa() flattens parcels and agents into parallel NumPy
+arrays; step_soa() runs one round of the 7-step pipeline on them with
+vectorised scoring, expiry, sorting and eligibility checks. The compiled
+kernel in model_jit.py runs the same layout when numba is installed.
+
+Both paths draw from the model's numpy Generator in the same order as
+GeorgistModel.step(), so a seeded run produces the same history either
+way. Parcel events go to a ring of rows in `events` when to_soa() is asked
+for them (events=True); ingest_soa() moves them to the model's EventLog.
+
+    soa = m.to_soa(steps)
+    step_soa_n(soa, steps)
+    m.ingest_soa(soa)
+"""
+
+import numpy as np
+
+from .events import EVENT_TYPES
+from .stats import gini_batch
+
+GRID_SIZE = 10
+N_PARCELS = GRID_SIZE * GRID_SIZE
+
+# Positional order expected by model_jit.step_many
+SOA_FIELDS = (
+    "rng", "params", "env", "community", "occupant", "lease_price", "rounds_vacant",
+    "wealth", "round_entered", "lease_start", "lease_length", "unhoused",
+    "counters", "history", "events",
+)
+
+# counters[] slots
+N_AGENTS, N_UNHOUSED, ROUND, ROUNDS_DONE, N_EVENTS = 0, 1, 2, 3, 4
+
+# events[] columns (one row per event; agent is an agent row, absent fields -1 / NaN)
+EV_ROUND, EV_PARCEL, EV_TYPE, EV_AGENT, EV_WEALTH, EV_LEASE_PRICE, EV_MARKET_VALUE, EV_LEASE_LENGTH = range(8)
+EVENT_COLUMNS = 8
+LEASE_EXPIRED, PRICED_OUT, AUCTION_WON, OCCUPIED = (
+    EVENT_TYPES.index(name) for name in ("lease_expired", "priced_out", "auction_won", "occupied")
+)
+
+GINI_COLUMN = 8
+GINI_BLOCK = 64   # rounds of wealth snapshots held before one gini_batch call
+
+# Jane's 2-ring neighbourhood: +1 per ring-1 neighbour, +0.5 per ring-2
+COMMUNITY_KERNEL = np.array([
+    [0.5, 0.5, 0.5, 0.5, 0.5],
+    [0.5, 1.0, 1.0, 1.0, 0.5],
+    [0.5, 1.0, 0.0, 1.0, 0.5],
+    [0.5, 1.0, 1.0, 1.0, 0.5],
+    [0.5, 0.5, 0.5, 0.5, 0.5],
+])
+
+
+def community_scores(occupied: np.ndarray) -> np.ndarray:
+    """Community score for every parcel from a flat occupancy mask."""
+    padded = np.zeros((GRID_SIZE + 4, GRID_SIZE + 4))
+    padded[2:-2, 2:-2] = occupied.reshape(GRID_SIZE, GRID_SIZE)
+    windows = np.lib.stride_tricks.sliding_window_view(padded, (5, 5))
+    return np.einsum("ijkl,kl->ij", windows, COMMUNITY_KERNEL).ravel()
+
+
+def _log_events(soa: dict, rows: np.ndarray) -> None:
+    """Append event rows to the `events` ring (callers skip this when it has no rows)."""
+    events = soa["events"]
+    counters = soa["counters"]
+    events[(counters[N_EVENTS] + np.arange(rows.shape[0])) % events.shape[0]] = rows
+    counters[N_EVENTS] += rows.shape[0]
+
+
+def _event_rows(round_num, parcel, event_type, agent, wealth=-1, lease_price=np.nan,
+                market_value=np.nan, lease_length=-1) -> np.ndarray:
+    """Event rows from per-field scalars / arrays (broadcast to one length)."""
+    columns = np.broadcast_arrays(
+        round_num, parcel, event_type, agent, wealth, lease_price, market_value, lease_length,
+    )
+    return np.column_stack(columns).astype(np.float64)
+
+
+def _record(soa: dict, market_values: np.ndarray, snapshots: list = None) -> None:
+    """
+    One history row, column order as in model.HISTORY_COLUMNS.
+    With a `snapshots` list, this round's population wealth is appended to
+    it and the Gini column is left for a later gini_batch call.
+    """
+    counters = soa["counters"]
+    occupant = soa["occupant"]
+    wealth = soa["wealth"]
+    lease_price = soa["lease_price"]
+    n_unhoused = counters[N_UNHOUSED]
+
+    housed_wealth = wealth[occupant[occupant >= 0]].astype(np.float64)
+    unhoused_wealth = wealth[soa["unhoused"][:n_unhoused]].astype(np.float64)
+    housed = housed_wealth.size
+    leases = lease_price[~np.isnan(lease_price)]
+
+    # Sequential sums keep float rounding identical to GeorgistModel's metrics
+    row = soa["history"][counters[ROUNDS_DONE]]
+    row[0] = counters[ROUND]
+    row[1] = housed / 100
+    row[2] = n_unhoused
+    row[3] = housed + n_unhoused
+    row[4] = sum(market_values.tolist()) / 100
+    row[5] = sum(leases.tolist()) / leases.size if leases.size else 0.0
+    row[6] = housed_wealth.sum() / housed if housed else 0.0
+    row[7] = unhoused_wealth.sum() / n_unhoused if n_unhoused else 0.0
+    population = np.concatenate([housed_wealth, unhoused_wealth])
+    if snapshots is None:
+        row[GINI_COLUMN] = gini_batch(population)
+    else:
+        snapshots.append(population)
+    counters[ROUNDS_DONE] += 1
+
+
+def unhoused_room(soa: dict) -> bool:
+    """
+    Whether `unhoused` can take one more round: at most the current unhoused
+    plus every parcel's defender and the immigrants. An agent whose leases
+    on several parcels expire together is listed once per parcel, so the
+    list can outgrow the agent count — see grow_unhoused().
+    """
+    return soa["counters"][N_UNHOUSED] + N_PARCELS + soa["params"][0] <= soa["unhoused"].size
+
+
+def grow_unhoused(soa: dict) -> None:
+    """Double the `unhoused` buffer, keeping its live front segment."""
+    n_unhoused = soa["counters"][N_UNHOUSED]
+    unhoused = np.zeros(2 * soa["unhoused"].size, dtype=np.int64)
+    unhoused[:n_unhoused] = soa["unhoused"][:n_unhoused]
+    soa["unhoused"] = unhoused
+
+
+def step_soa(soa: dict, snapshots: list = None) -> None:
+    """Advance the array state by one round in place (see _record for `snapshots`)."""
+    while not unhoused_room(soa):
+        grow_unhoused(soa)
+    rng = soa["rng"]
+    immigration_rate, min_lease, max_lease, max_wealth, vacancy_decay, env_w, comm_w = soa["params"]
+    env = soa["env"]
+    occupant = soa["occupant"]
+    lease_price = soa["lease_price"]
+    rounds_vacant = soa["rounds_vacant"]
+    wealth = soa["wealth"]
+    lease_start = soa["lease_start"]
+    lease_length = soa["lease_length"]
+    unhoused = soa["unhoused"]
+    counters = soa["counters"]
+    log_events = soa["events"].shape[0] > 0
+
+    counters[ROUND] += 1
+    round_num = counters[ROUND]
+
+    # Step 1: Community scores
+    soa["community"][:] = community_scores(occupant >= 0)
+    market_values = env * env_w + soa["community"] * comm_w
+
+    # Step 2: Vacancy counters
+    vacant = occupant < 0
+    rounds_vacant[vacant] += 1
+    rounds_vacant[~vacant] = 0
+
+    # Step 3: Identify expired leases
+    occ = np.where(vacant, 0, occupant)
+    expired = ~vacant & (lease_start[occ] >= 0) & (lease_start[occ] + lease_length[occ] == round_num)
+    expired_idx = np.flatnonzero(expired)
+    defenders = occupant[expired_idx].copy()
+    if log_events and expired_idx.size:
+        _log_events(soa, _event_rows(
+            round_num, expired_idx, LEASE_EXPIRED, defenders, wealth[defenders],
+            lease_price[expired_idx], market_values[expired_idx],
+        ))
+    occupant[expired_idx] = -1
+    lease_price[expired_idx] = np.nan
+
+    # Vacant lots also go to auction
+    vacant_idx = np.flatnonzero(vacant)
+    vacant_mv = market_values[vacant_idx]
+    if vacancy_decay:
+        decayed = rounds_vacant[vacant_idx] > 0
+        vacant_mv[decayed] = np.maximum(1.0, vacant_mv[decayed] - rounds_vacant[vacant_idx][decayed] * 0.5)
+
+    lot_idx = np.concatenate([expired_idx, vacant_idx])
+    lot_mv = np.concatenate([market_values[expired_idx], vacant_mv])
+    lot_defender = np.concatenate([defenders, np.full(vacant_idx.size, -1, dtype=np.int64)])
+
+    # Step 4: Collect agents (expired + unhoused + immigrants)
+    first_new = counters[N_AGENTS]
+    new_rows = np.arange(first_new, first_new + immigration_rate)
+    counters[N_AGENTS] += immigration_rate
+    wealth[new_rows] = rng.integers(1, max_wealth + 1, size=immigration_rate)
+    soa["round_entered"][new_rows] = round_num
+    lease_start[new_rows] = -1
+    lease_length[new_rows] = -1
+    entries = np.concatenate([defenders, unhoused[:counters[N_UNHOUSED]], new_rows])
+
+    # Step 5 & 6: Stable descending sorts, then auctions
+    lot_order = np.argsort(-lot_mv, kind="stable")
+    entries = entries[np.argsort(-wealth[entries], kind="stable")]
+    entry_wealth = wealth[entries]
+    placed = np.zeros(wealth.size, dtype=bool)
+    won = []   # (parcel, winner, price, market value, lease length, contested) in auction order
+
+    for li in lot_order:
+        market_value = lot_mv[li]
+        defender = lot_defender[li]
+
+        # Entries are wealth-descending, so the affordable ones are a prefix
+        n_afford = np.searchsorted(-entry_wealth, -market_value, side="right")
+        candidates = entries[:n_afford]
+        open_mask = ~placed[candidates]
+        if not open_mask.any():
+            if log_events and defender >= 0:
+                _log_events(soa, _event_rows(round_num, lot_idx[li], PRICED_OUT, defender, market_value=market_value))
+            continue
+        first = candidates[open_mask.argmax()]
+
+        if defender < 0:
+            winner, price = first, market_value
+        else:
+            challenger_mask = open_mask & (candidates != defender)
+            if not challenger_mask.any():
+                winner, price = defender, market_value
+            else:
+                challenger = candidates[challenger_mask.argmax()]
+                if wealth[challenger] > wealth[defender]:
+                    winner, price = challenger, max(market_value, wealth[defender] + 1.0)
+                elif wealth[challenger] == wealth[defender]:
+                    winner, price = defender, float(wealth[challenger])
+                else:
+                    winner, price = defender, max(market_value, wealth[challenger] + 1.0)
+
+        idx = lot_idx[li]
+        lease_start[winner] = round_num
+        lease_length[winner] = rng.integers(min_lease, max_lease + 1)
+        occupant[idx] = winner
+        lease_price[idx] = price
+        rounds_vacant[idx] = 0
+        placed[winner] = True
+        if log_events:
+            won.append((idx, winner, price, market_value, lease_length[winner], defender >= 0))
+
+    # Wins are logged after the round's priced-out defenders, as in GeorgistModel.step()
+    if won:
+        idx, winner, price, market_value, length, contested = (np.array(col) for col in zip(*won))
+        _log_events(soa, _event_rows(
+            round_num, idx, np.where(contested, AUCTION_WON, OCCUPIED), winner, wealth[winner],
+            price, market_value, length,
+        ))
+
+    # Step 6 continued: unplaced → unhoused
+    unplaced = entries[~placed[entries]]
+    lease_start[unplaced] = -1
+    lease_length[unplaced] = -1
+    unhoused[:unplaced.size] = unplaced
+    counters[N_UNHOUSED] = unplaced.size
+
+    # Step 7: Final recalc + history row
+    soa["community"][:] = community_scores(occupant >= 0)
+    _record(soa, env * env_w + soa["community"] * comm_w, snapshots)
+
+
+def step_soa_n(soa: dict, steps: int, jit: bool = False) -> None:
+    """
+    Advance the array state by `steps` rounds. With jit=True the compiled
+    kernel in model_jit runs instead (requires numba).
+    """
+    if jit:
+        # step_many stops early when `unhoused` is out of room; grow and resume
+        from .model_jit import step_many
+        target = soa["counters"][ROUNDS_DONE] + steps
+        while soa["counters"][ROUNDS_DONE] < target:
+            step_many(*(soa[k] for k in SOA_FIELDS), target - soa["counters"][ROUNDS_DONE])
+            if soa["counters"][ROUNDS_DONE] < target:
+                grow_unhoused(soa)
+        return
+
+    # Gini for a block of rounds in one vectorised call over a NaN-padded
+    # (rounds, population) float32 buffer
+    history = soa["history"]
+    for start in range(0, steps, GINI_BLOCK):
+        block = min(GINI_BLOCK, steps - start)
+        first_row = soa["counters"][ROUNDS_DONE]
+        snapshots = []
+        for _ in range(block):
+            step_soa(soa, snapshots)
+        buffer = np.full((block, max(p.size for p in snapshots)), np.nan, dtype=np.float32)
+        for k, population in enumerate(snapshots):
+            buffer[k, :population.size] = population
+        history[first_row:first_row + block, GINI_COLUMN] = gini_batch(buffer)
+
+
+def step_detached(soa: dict, steps: int, jit: bool = False) -> dict:
+    """
+    step_soa_n for a worker process. The arrays (and rng) arrive as a pickled
+    copy, so the advanced copy is returned for GeorgistModel.ingest_soa().
+    """
+    step_soa_n(soa, steps, jit)
+    return soa
+
+
+def advance(model, steps: int, jit: bool = False, events: bool = False) -> None:
+    """
+    Advance a GeorgistModel by `steps` rounds through the array path.
+    With events=True parcel events are logged as GeorgistModel.step() would.
+    """
+    soa = model.to_soa(steps, events=events)
+    step_soa_n(soa, steps, jit)
+    model.ingest_soa(soa)
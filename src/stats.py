@@ -0,0 +1,26 @@
+"""
+Vectorised summary statistics for the Georgist Land Value Simulation.
+"""
+
+import numpy as np
+
+
+def gini_batch(W: np.ndarray) -> np.ndarray:
+    """
+    Gini coefficient along the last axis of a (..., N) wealth array.
+
+    One sort plus one weighted sum per row:
+        G = 2 * Σ i·w_(i) / (N · Σ w) − (N + 1) / N
+    Rows may be padded with NaN (populations differ between rounds);
+    rows with fewer than two agents or zero total wealth give 0.
+    """
+    W = np.sort(np.asarray(W, dtype=np.float64), axis=-1)   # NaN sorts last
+    valid = ~np.isnan(W)
+    n = valid.sum(axis=-1)
+    W = np.where(valid, W, 0.0)
+    idx = np.arange(1, W.shape[-1] + 1)
+    total = W.sum(axis=-1)
+    weighted = (idx * W).sum(axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        g = (2 * weighted) / (n * total) - (n + 1) / n
+    return np.where((n > 1) & (total > 0), g, 0.0)
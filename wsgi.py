@@ -0,0 +1,14 @@
+"""
+WSGI entrypoint for production servers (see Procfile / railway.json):
+
+    gunicorn wsgi:app -k gthread -w 1 --threads 8 --bind 0.0.0.0:$PORT
+
+Sessions and their models live in the server process, so run one worker
+and scale with threads; long batches go to the step-job process pool
+(POST /api/step with "background": true). `python server.py` still starts
+the werkzeug dev server for local work.
+"""
+
+from server import app
+
+__all__ = ["app"]